@@ -38,6 +38,9 @@ def create_app(config_class=None):
     # Initialize services
     _init_services(app)
 
+    # Register request hooks
+    _register_request_hooks(app)
+
     # Register blueprints
     _register_blueprints(app)
 
@@ -63,6 +66,16 @@ def _init_services(app):
     app.config['feed_service'] = FeedService(app.config)
 
 
+def _register_request_hooks(app):
+    """Register per-request hooks"""
+    from flask import g
+
+    @app.before_request
+    def stamp_request_time():
+        # Read the clock once per request; services take it via now=g._now
+        g._now = time.monotonic()
+
+
 def _register_blueprints(app):
     """Register all route blueprints"""
     from .routes import main_bp, api_bp, feed_bp, stream_bp
@@ -46,6 +46,7 @@ class Config:
 
     # Cache
     ROI_CACHE_DURATION = 30  # seconds
+    SEND_FILE_MAX_AGE_DEFAULT = 3600  # seconds, /static/* (dashboard.css, images)
 
     # Chat
     MAX_CHAT_MESSAGES = 50
@@ -3,12 +3,12 @@ API Routes Blueprint
 
 REST API endpoints for metrics, users, chat, and alerts.
 """
-from flask import Blueprint, jsonify, request, Response
+from flask import Blueprint, jsonify, request, Response, g
 from app.extensions import limiter
-from app.services.mqtt_service import sensor_data
 from app.services.user_service import UserService
+from app.services.metrics_service import MetricsService, METRICS_PAYLOAD_TTL
+from app.utils.helpers import json_response
 from app.utils.auth import get_username_from_jwt, get_authenticated_username, require_local_network_email
-from app.utils.helpers import get_cpu_temp, get_system_stats, format_bme680_data, format_camera_metadata
 import time
 import queue
 import threading
@@ -21,24 +21,40 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 announcement_queue = queue.Queue(maxsize=5)
 announcement_lock = threading.Lock()
 
+# Idle SSE streams send a comment this often so proxies keep them open
+METRICS_STREAM_KEEPALIVE = 15  # seconds
+
 
 @api_bp.route('/metrics')
 def api_metrics():
     """API endpoint for metrics data"""
-    metrics = {
-        'cpu_temperature': get_cpu_temp(),
-        'system': get_system_stats(),
-        'i2c_sensors': {
-            'bme680': format_bme680_data(sensor_data.get('bme680', {}))
-        },
-        'camera': format_camera_metadata(sensor_data.get('camera', {})),
-        'audio_level': sensor_data.get('audio_level', 0),
-        'water': sensor_data.get('water', {}),
-        'food': sensor_data.get('food', {}),
-        'weather': sensor_data.get('weather', {}),
-        'last_update': sensor_data.get('last_update', 0)
-    }
-    return jsonify(metrics)
+    body, etag = MetricsService.get_payload(now=g._now)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+@api_bp.route('/metrics/stream')
+def api_metrics_stream():
+    """Push the cached metrics body to the client whenever it changes (SSE)"""
+    def generate():
+        # time.sleep is green under eventlet, so each stream is an idle greenlet
+        last_etag = None
+        idle = 0.0
+        while True:
+            body, etag = MetricsService.get_payload()
+            if etag != last_etag:
+                last_etag = etag
+                idle = 0.0
+                yield b'data: ' + body + b'\n\n'
+            elif idle >= METRICS_STREAM_KEEPALIVE:
+                idle = 0.0
+                yield b': keep-alive\n\n'
+            time.sleep(METRICS_PAYLOAD_TTL)
+            idle += METRICS_PAYLOAD_TTL
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @api_bp.route('/heartbeat', methods=['POST'])
@@ -48,9 +64,9 @@ def api_heartbeat():
     username = get_authenticated_username()
     state = request.json.get('state', 'viewing') if request.is_json else 'viewing'
 
-    UserService.update_activity(username, state)
+    UserService.update_activity(username, state, now=g._now)
 
-    return jsonify({
+    return json_response({
         'status': 'ok',
         'username': username,
         'server_time': int(time.time())
@@ -69,10 +85,8 @@ def api_user_left():
 @api_bp.route('/active_users')
 def api_active_users():
     """Get list of active users"""
-    return jsonify({
-        'users': UserService.get_active_list(),
-        'count': len(UserService.get_active_list())
-    })
+    return Response(UserService.get_active_payload(now=g._now),
+                    mimetype='application/json')
 
 
 @api_bp.route('/chat/send', methods=['POST'])
@@ -107,7 +121,7 @@ def api_chat_send():
 @api_bp.route('/chat/messages')
 def api_chat_messages():
     """Get recent chat messages"""
-    return jsonify({
+    return json_response({
         'messages': UserService.get_chat_messages()
     })
 
@@ -119,7 +133,7 @@ def lights_countdown():
     from flask import current_app
     alert_service = current_app.config.get('alert_service')
     if alert_service:
-        return jsonify(alert_service.get_lights_countdown())
+        return json_response(alert_service.get_lights_countdown())
     return jsonify({'error': 'Alert service not available'}), 503
 
 
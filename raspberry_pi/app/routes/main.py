@@ -3,33 +3,74 @@ Main Routes Blueprint
 
 Index page and static content routes.
 """
-from flask import Blueprint, render_template, send_from_directory, request
+import os
+import gzip
+import zlib
+from flask import Blueprint, render_template, send_from_directory, request, Response, current_app, g
+from app.services.metrics_service import MetricsService
 
 main_bp = Blueprint('main', __name__)
 
+# Absolute static paths (relative directories would resolve against app/)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'static')
+STATIC_IMAGES_DIR = os.path.join(STATIC_DIR, 'images')
+
+# Dashboard HTML rendered (and gzipped) once per process; index.html has no
+# per-request variables. Format: (body, gzip_body, etag)
+_index_page = None
+
+
+def _get_index_page():
+    """Render index.html on first use (every time in debug for live edits)"""
+    global _index_page
+    if _index_page is None or current_app.debug:
+        body = render_template('index.html').encode('utf-8')
+        _index_page = (body, gzip.compress(body, compresslevel=9),
+                       format(zlib.crc32(body), '08x'))
+    return _index_page
+
 
 @main_bp.route('/')
 def index():
     """Serve the main dashboard"""
-    return render_template('index.html')
+    body, gzip_body, etag = _get_index_page()
+    if 'gzip' in request.accept_encodings:
+        response = Response(gzip_body, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gz'  # Distinct representation, distinct validator
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
+
+
+@main_bp.route('/metrics')
+def prometheus_metrics():
+    """Prometheus scrape endpoint (same cached snapshot as /api/metrics)"""
+    return Response(MetricsService.get_prometheus_payload(now=g._now),
+                    content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
 @main_bp.route('/chicken_image')
 def chicken_image():
     """Serve chicken logo"""
-    return send_from_directory('static/images', 'chicken_of_despair.png')
+    return send_from_directory(STATIC_IMAGES_DIR, 'chicken_of_despair.png',
+                               mimetype='image/png', conditional=True, max_age=86400)
 
 
 @main_bp.route('/usb_test')
 def usb_test():
     """USB camera test page"""
-    return send_from_directory('static', 'usb_test.html')
+    return send_from_directory(STATIC_DIR, 'usb_test.html')
 
 
 @main_bp.route('/csi_test')
 def csi_test():
     """CSI camera test page"""
-    return send_from_directory('static', 'csi_test.html')
+    return send_from_directory(STATIC_DIR, 'csi_test.html')
 
 
 @main_bp.route('/train-feed')
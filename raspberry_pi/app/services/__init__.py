@@ -4,15 +4,17 @@ BeeperKeeper Services
 Business logic and shared state management.
 """
 from .mqtt_service import MQTTService, sensor_data
-from .user_service import UserService, active_users
+from .user_service import UserService, active_user_shards
 from .alert_service import AlertService
 from .feed_service import FeedService
+from .metrics_service import MetricsService
 
 __all__ = [
     'MQTTService',
     'sensor_data',
     'UserService',
-    'active_users',
+    'active_user_shards',
     'AlertService',
-    'FeedService'
+    'FeedService',
+    'MetricsService'
 ]
@@ -0,0 +1,117 @@
+"""
+Metrics Service
+
+Builds the /api/metrics payload once per cycle and serves the cached bytes.
+The same snapshot is exposed in Prometheus text format at /metrics.
+"""
+import time
+import zlib
+import app.services.mqtt_service as mqtt_state
+from app.utils.helpers import (
+    dumps_json, get_cpu_temp, get_system_stats,
+    format_bme680_data, format_camera_metadata
+)
+
+# Dashboard polls every 2s; CPU temp and system stats are sampled live, so
+# rebuild at most once per interval (or sooner when new MQTT data arrives)
+METRICS_PAYLOAD_TTL = 2.0  # seconds
+
+# (version, built_at, body, etag, metrics), swapped as one reference
+_metrics_cache = (-1, 0.0, b'{}', '', {})
+
+# (etag, body) of the Prometheus text rendered from the cached metrics
+_prometheus_cache = ('', b'')
+
+# Prometheus gauge name -> path into the metrics dict
+PROMETHEUS_GAUGES = (
+    ('beeper_cpu_temperature_celsius', ('cpu_temperature',)),
+    ('beeper_cpu_percent', ('system', 'cpu_percent')),
+    ('beeper_memory_percent', ('system', 'memory_percent')),
+    ('beeper_disk_percent', ('system', 'disk_percent')),
+    ('beeper_uptime_seconds', ('system', 'uptime_seconds')),
+    ('beeper_temperature_celsius', ('i2c_sensors', 'bme680', 'temperature')),
+    ('beeper_humidity_percent', ('i2c_sensors', 'bme680', 'humidity')),
+    ('beeper_pressure_hpa', ('i2c_sensors', 'bme680', 'pressure')),
+    ('beeper_gas_resistance_ohms', ('i2c_sensors', 'bme680', 'gas_raw')),
+    ('beeper_iaq', ('i2c_sensors', 'bme680', 'iaq')),
+    ('beeper_iaq_accuracy', ('i2c_sensors', 'bme680', 'iaq_accuracy')),
+    ('beeper_co2_equivalent_ppm', ('i2c_sensors', 'bme680', 'co2_equivalent')),
+    ('beeper_camera_lux', ('camera', 'lux')),
+    ('beeper_audio_level_db', ('audio_level',)),
+    ('beeper_feed_percent', ('food', 'percentage')),
+    ('beeper_feed_confidence', ('food', 'confidence')),
+    ('beeper_last_update_timestamp_seconds', ('last_update',)),
+)
+
+
+class MetricsService:
+    """Cached dashboard metrics"""
+
+    @staticmethod
+    def build_metrics():
+        """Assemble the metrics dict from live system info and MQTT data"""
+        # Top-level snapshot; nested dicts are swapped wholesale by the MQTT thread
+        with mqtt_state.sensor_data_lock:
+            sensor_data = mqtt_state.sensor_data.copy()
+        return {
+            'cpu_temperature': get_cpu_temp(),
+            'system': get_system_stats(),
+            'i2c_sensors': {
+                'bme680': format_bme680_data(sensor_data.get('bme680', {}))
+            },
+            'camera': format_camera_metadata(sensor_data.get('camera', {})),
+            'audio_level': sensor_data.get('audio_level', 0),
+            'water': sensor_data.get('water', {}),
+            'food': sensor_data.get('food', {}),
+            'weather': sensor_data.get('weather', {}),
+            'last_update': sensor_data.get('last_update', 0)
+        }
+
+    @staticmethod
+    def _get_cache(now=None):
+        """Return the current cache entry, rebuilding it if stale"""
+        global _metrics_cache
+        current_time = time.monotonic() if now is None else now
+
+        cache = _metrics_cache
+        version, built_at = cache[0], cache[1]
+        if (version == mqtt_state.sensor_data_version and
+                current_time - built_at < METRICS_PAYLOAD_TTL):
+            return cache
+
+        # Read the version before building so a concurrent update forces a rebuild
+        version = mqtt_state.sensor_data_version
+        metrics = MetricsService.build_metrics()
+        body = dumps_json(metrics)
+        etag = format(zlib.crc32(body), '08x')
+        _metrics_cache = cache = (version, current_time, body, etag, metrics)
+        return cache
+
+    @staticmethod
+    def get_payload(now=None):
+        """Get (body, etag) for /api/metrics, reused until stale"""
+        _, _, body, etag, _ = MetricsService._get_cache(now)
+        return body, etag
+
+    @staticmethod
+    def get_prometheus_payload(now=None):
+        """Get the cached metrics in Prometheus text exposition format"""
+        global _prometheus_cache
+        _, _, _, etag, metrics = MetricsService._get_cache(now)
+
+        cached_etag, body = _prometheus_cache
+        if cached_etag == etag:
+            return body
+
+        lines = []
+        for name, path in PROMETHEUS_GAUGES:
+            value = metrics
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            # Skip missing readings (e.g. IAQ while BSEC is calibrating)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            lines.append(f'# TYPE {name} gauge\n{name} {value}\n')
+        body = ''.join(lines).encode('utf-8')
+        _prometheus_cache = (etag, body)
+        return body
@@ -5,9 +5,14 @@ Handles MQTT client connection and message processing.
 """
 import paho.mqtt.client as mqtt
 import json
+import itertools
 import threading
 
+from app.utils.helpers import dumps_json, loads_json
+
 # Global sensor data storage
+# Values are replaced, never mutated in place: a shallow copy taken by a
+# reader is then a consistent snapshot of every nested dict.
 sensor_data = {
     'bme680': {},
     'camera': {},
@@ -22,6 +27,11 @@ sensor_data = {
 
 sensor_data_lock = threading.Lock()
 
+# Bumped after every applied message so cached payloads built from
+# sensor_data know when to rebuild (see MetricsService)
+_version_counter = itertools.count(1)
+sensor_data_version = 0
+
 
 class MQTTService:
     """MQTT client management"""
@@ -67,9 +77,10 @@ class MQTTService:
     def _on_message(self, client, userdata, msg):
         """Process incoming MQTT messages"""
         import time
+        global sensor_data_version
         try:
             topic = msg.topic
-            payload = json.loads(msg.payload.decode())
+            payload = loads_json(msg.payload)  # bytes straight in, no decode() copy
 
             with sensor_data_lock:
                 # BME680 sensor data
@@ -94,10 +105,9 @@ class MQTTService:
                     sensor_data['audio_level'] = payload.get('level_db', 0)
 
                 # Water sensor
+                # (merged into a new dict so readers never see one mid-update)
                 elif topic.startswith("beeper/water/"):
-                    if 'water' not in sensor_data:
-                        sensor_data['water'] = {}
-                    sensor_data['water'].update(payload)
+                    sensor_data['water'] = {**sensor_data.get('water', {}), **payload}
 
                 # Feed level - transform field names for frontend
                 elif topic == "beeper/feed/level/all":
@@ -112,6 +122,13 @@ class MQTTService:
                 elif topic == "beeper/weather/all":
                     sensor_data['weather'] = payload
 
+                # Subscribed via a wildcard but not shown (lights, bsec, feed/level/current...):
+                # nothing changed, so keep the version and the cached payloads/ETag
+                else:
+                    return
+
+            sensor_data_version = next(_version_counter)
+
         except json.JSONDecodeError:
             pass
         except Exception as e:
@@ -124,7 +141,7 @@ class MQTTService:
     def publish(self, topic, payload):
         """Publish message to MQTT"""
         if self.client:
-            self.client.publish(topic, json.dumps(payload) if isinstance(payload, dict) else payload)
+            self.client.publish(topic, dumps_json(payload) if isinstance(payload, dict) else payload)
 
     def disconnect(self):
         """Disconnect from MQTT broker"""
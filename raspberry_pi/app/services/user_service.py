@@ -4,18 +4,43 @@ User Service
 Manages active users and chat functionality.
 """
 import time
+import itertools
 import threading
 from collections import deque
+from app.utils.helpers import dumps_json
 
 # Active users tracking (ephemeral, in-memory)
-# Format: { 'username': {'last_seen': timestamp, 'state': 'viewing'|'away', 'first_seen': timestamp} }
-active_users = {}
-active_users_lock = threading.Lock()
+# Users are spread over USER_SHARDS dicts, each guarded by its own lock, so
+# concurrent heartbeats for different users rarely contend.
+# Format per shard: { 'username': (last_seen, first_seen, state) } with state 'viewing'|'away'
+# Timestamps are time.monotonic() values so NTP steps can't skew staleness checks
+USER_SHARDS = 8  # must be a power of two
+active_user_shards = [{} for _ in range(USER_SHARDS)]
+active_user_locks = [threading.Lock() for _ in range(USER_SHARDS)]
+
+# Replaced whenever any shard changes; keys the pre-serialized list below.
+# next() on itertools.count is atomic, so no extra lock is needed.
+_version_counter = itertools.count(1)
+_list_version = 0
+# (version, built_at, body) for /api/active_users, swapped as one reference
+_active_payload_cache = (-1, 0.0, b'')
+ACTIVE_PAYLOAD_TTL = 1.0  # seconds, matches last_seen_seconds resolution
+
+
+def _shard(username):
+    """Return the (users, lock) shard that owns username"""
+    index = hash(username) & (USER_SHARDS - 1)
+    return active_user_shards[index], active_user_locks[index]
+
 
 # Chat messages (ephemeral, last 50)
 chat_messages = deque(maxlen=50)
 chat_lock = threading.Lock()
 
+# Immutable copy of chat_messages, rebuilt by writers and swapped in with a
+# single reference assignment so readers never need chat_lock
+_chat_snapshot = ()
+
 MAX_CHAT_MESSAGES = 50
 USER_TIMEOUT = 120  # seconds before user considered stale
 
@@ -24,77 +49,104 @@ class UserService:
     """User and chat management"""
 
     @staticmethod
-    def update_activity(username, state='viewing'):
+    def update_activity(username, state='viewing', now=None):
         """Update user's activity timestamp"""
+        global _list_version
         if not username:
             return
 
-        with active_users_lock:
-            current_time = time.time()
-            if username in active_users:
-                active_users[username]['last_seen'] = current_time
-                active_users[username]['state'] = state
-            else:
-                active_users[username] = {
-                    'last_seen': current_time,
-                    'first_seen': current_time,
-                    'state': state
-                }
+        current_time = time.monotonic() if now is None else now
+        users, lock = _shard(username)
+        with lock:
+            entry = users.get(username)
+            first_seen = entry[1] if entry else current_time
+            users[username] = (current_time, first_seen, state)
+        _list_version = next(_version_counter)
 
     @staticmethod
     def remove_user(username):
         """Remove user from active users"""
-        with active_users_lock:
-            if username in active_users:
-                del active_users[username]
+        global _list_version
+        users, lock = _shard(username)
+        with lock:
+            removed = users.pop(username, None)
+        if removed is not None:
+            _list_version = next(_version_counter)
 
     @staticmethod
-    def cleanup_stale():
+    def cleanup_stale(now=None):
         """Remove users not seen in the last 2 minutes"""
-        with active_users_lock:
-            current_time = time.time()
-            stale_users = [
-                username for username, data in active_users.items()
-                if current_time - data['last_seen'] > USER_TIMEOUT
-            ]
-            for username in stale_users:
-                del active_users[username]
+        global _list_version
+        current_time = time.monotonic() if now is None else now
+        removed_any = False
+        for users, lock in zip(active_user_shards, active_user_locks):
+            with lock:
+                stale_users = [
+                    username for username, (last_seen, _, _) in users.items()
+                    if current_time - last_seen > USER_TIMEOUT
+                ]
+                for username in stale_users:
+                    del users[username]
+            removed_any = removed_any or bool(stale_users)
+        if removed_any:
+            _list_version = next(_version_counter)
 
     @staticmethod
-    def get_active_list():
+    def get_active_list(now=None):
         """Get list of active users with their status"""
-        UserService.cleanup_stale()
-
-        with active_users_lock:
-            current_time = time.time()
-            users_list = []
-
-            for username, data in active_users.items():
-                last_seen = data['last_seen']
-                time_since = current_time - last_seen
-
-                # Determine current state
-                if time_since < 30:
-                    status = 'active'
-                elif time_since < 60:
-                    status = 'idle'
-                else:
-                    status = 'away'
-
-                users_list.append({
-                    'username': username,
-                    'status': status,
-                    'state': data.get('state', 'viewing'),
-                    'last_seen_seconds': int(time_since)
-                })
-
-            # Sort by most recently active
-            users_list.sort(key=lambda x: x['last_seen_seconds'])
-            return users_list
+        current_time = time.monotonic() if now is None else now
+        UserService.cleanup_stale(current_time)
+
+        # Snapshot each shard under its own lock, then build outside any lock
+        entries = []
+        for users, lock in zip(active_user_shards, active_user_locks):
+            with lock:
+                entries.extend(users.items())
+
+        users_list = []
+        for username, (last_seen, first_seen, state) in entries:
+            time_since = current_time - last_seen
+
+            # Determine current state
+            if time_since < 30:
+                status = 'active'
+            elif time_since < 60:
+                status = 'idle'
+            else:
+                status = 'away'
+
+            users_list.append({
+                'username': username,
+                'status': status,
+                'state': state,
+                'last_seen_seconds': int(time_since)
+            })
+
+        # Sort by most recently active
+        users_list.sort(key=lambda x: x['last_seen_seconds'])
+        return users_list
+
+    @staticmethod
+    def get_active_payload(now=None):
+        """Get active users as a JSON body, reused while nothing has changed"""
+        global _active_payload_cache
+        current_time = time.monotonic() if now is None else now
+
+        version, built_at, body = _active_payload_cache
+        if version == _list_version and current_time - built_at < ACTIVE_PAYLOAD_TTL:
+            return body
+
+        # Read the version before building so a concurrent change forces a rebuild
+        version = _list_version
+        users_list = UserService.get_active_list(current_time)
+        body = dumps_json({'users': users_list, 'count': len(users_list)})
+        _active_payload_cache = (version, current_time, body)
+        return body
 
     @staticmethod
     def add_chat_message(username, message, message_type='chat'):
         """Add a chat message"""
+        global _chat_snapshot
         with chat_lock:
             chat_messages.append({
                 'username': username,
@@ -102,9 +154,9 @@ class UserService:
                 'type': message_type,
                 'timestamp': time.time()
             })
+            _chat_snapshot = tuple(chat_messages)
 
     @staticmethod
     def get_chat_messages():
-        """Get recent chat messages"""
-        with chat_lock:
-            return list(chat_messages)
+        """Get recent chat messages (lock-free snapshot read)"""
+        return list(_chat_snapshot)
@@ -2,12 +2,15 @@
 BeeperKeeper Utilities
 """
 from .auth import get_username_from_jwt, require_local_network_email
-from .helpers import get_cpu_temp, get_system_stats, format_bme680_data
+from .helpers import get_cpu_temp, get_system_stats, format_bme680_data, dumps_json, loads_json, json_response
 
 __all__ = [
     'get_username_from_jwt',
     'require_local_network_email',
     'get_cpu_temp',
     'get_system_stats',
-    'format_bme680_data'
+    'format_bme680_data',
+    'dumps_json',
+    'loads_json',
+    'json_response'
 ]
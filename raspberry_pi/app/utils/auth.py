@@ -27,7 +27,7 @@ def get_username_from_jwt():
         if email:
             # Return username (everything before @)
             return email.split('@')[0]
-    except (InvalidTokenError, Exception):
+    except (InvalidTokenError, ValueError, KeyError, AttributeError, TypeError):
         pass
 
     return None
@@ -85,11 +85,11 @@ def require_local_network_email(f):
                     'message': 'Only @YOUR_DOMAIN emails are allowed'
                 }), 403
 
-        except (InvalidTokenError, Exception) as e:
+        except (InvalidTokenError, ValueError, KeyError, AttributeError, TypeError):
             from flask import jsonify
             return jsonify({
                 'error': 'Invalid token',
-                'message': str(e)
+                'message': 'Cloudflare Access token could not be decoded'
             }), 401
 
         return f(*args, **kwargs)
@@ -3,31 +3,91 @@ Helper Utilities
 
 Common helper functions for data formatting and system info.
 """
+import bisect
+import os
+import time
 import psutil
+from flask import Response
+
+try:
+    import orjson
+
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads_json(data):
+        """Parse JSON from bytes or str (errors subclass json.JSONDecodeError)"""
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads_json(data):
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+
+def json_response(obj, status=200):
+    """Build a JSON Response via dumps_json (cheaper than jsonify on hot endpoints)"""
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
+
+
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+_thermal_fd = None  # Kept open; sysfs regenerates the value on each pread at offset 0
 
 
 def get_cpu_temp():
     """Read CPU temperature from thermal zone"""
+    global _thermal_fd
     try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            return round(float(f.read().strip()) / 1000.0, 1)
+        if _thermal_fd is None:
+            _thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        # millidegrees -> tenths of a degree (rounded) in int math, one float divide
+        raw = int(os.pread(_thermal_fd, 16, 0))
+        return ((raw + 50) // 100) / 10
     except:
         return None
 
 
+# cpu_percent(interval=None) reports usage since the previous call; prime it
+# here so the first real sample isn't 0.0 and no call has to block
+psutil.cpu_percent(interval=None)
+BOOT_TIME = psutil.boot_time()  # Fixed for the life of the process
+
+# Disk usage changes slowly; poll it at most this often
+DISK_POLL_INTERVAL = 30  # seconds
+_disk_cache = (float('-inf'), 0.0)  # (checked_at, percent)
+
+
 def get_system_stats():
     """Get system statistics"""
+    global _disk_cache
     try:
+        now = time.monotonic()
+        checked_at, disk_percent = _disk_cache
+        if now - checked_at >= DISK_POLL_INTERVAL:
+            disk_percent = psutil.disk_usage('/').percent
+            _disk_cache = (now, disk_percent)
+
         return {
-            'cpu_percent': round(psutil.cpu_percent(interval=0.1), 1),
+            'cpu_percent': round(psutil.cpu_percent(interval=None), 1),
             'memory_percent': round(psutil.virtual_memory().percent, 1),
-            'disk_percent': round(psutil.disk_usage('/').percent, 1),
-            'uptime_seconds': int(psutil.time.time() - psutil.boot_time())
+            'disk_percent': round(disk_percent, 1),
+            'uptime_seconds': int(time.time() - BOOT_TIME)
         }
     except:
         return {}
 
 
+# IAQ classes: iaq <= IAQ_UPPER_BOUNDS[i] -> IAQ_CLASSES[i]; above all -> 'Severe'
+IAQ_UPPER_BOUNDS = (50, 100, 150, 200, 300)
+IAQ_CLASSES = ('Excellent', 'Good', 'Moderate', 'Poor', 'Very Poor', 'Severe')
+
+
 def format_bme680_data(data):
     """Format BME680 sensor data for display with BSEC calibration status"""
     if not data:
@@ -76,20 +136,9 @@ def format_bme680_data(data):
     else:
         result['calibration_status'] = 'ready'
 
-        # Classify IAQ level
+        # Classify IAQ level (bounds are inclusive, so bisect_left)
         iaq = data.get('iaq', 0)
-        if iaq <= 50:
-            iaq_class = 'Excellent'
-        elif iaq <= 100:
-            iaq_class = 'Good'
-        elif iaq <= 150:
-            iaq_class = 'Moderate'
-        elif iaq <= 200:
-            iaq_class = 'Poor'
-        elif iaq <= 300:
-            iaq_class = 'Very Poor'
-        else:
-            iaq_class = 'Severe'
+        iaq_class = IAQ_CLASSES[bisect.bisect_left(IAQ_UPPER_BOUNDS, iaq)]
 
         result.update({
             'iaq': round(data.get('iaq', 0), 1),
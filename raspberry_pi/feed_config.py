@@ -15,17 +15,35 @@ FINAL CORRECTION APPLIED: 2025-11-23
 - Previous config had EMPTY_Y=272 which exceeded ROI_HEIGHT=237
 """
 
+import dataclasses
+import math
+import sys
+import types
+import numpy as np
+
 # MQTT Broker Configuration
 MQTT_BROKER = '10.10.10.7'  # Docker host running Mosquitto
 MQTT_PORT = 1883
 MQTT_CLIENT_ID = 'beeper_feed_monitor'
 
+# MQTT topics (str: paho encodes the topic itself and rejects bytes)
+# All feed telemetry is published QoS 0 - a newer reading follows every minute
+TOPIC_FEED_LEVEL = 'beeper/feed/level/current'
+TOPIC_FEED_RAW = 'beeper/feed/level/raw'
+TOPIC_FEED_ALERTS = 'beeper/feed/alerts/status'
+FEED_PUBLISH_QOS = 0
+
 # Camera Configuration
 CAMERA_TYPE = 'csi'  # Changed from USB to CSI camera - 2025-11-18
 CAMERA_DEVICE = '/dev/video0'  # CSI camera device (OV5647 - 5MP camera module)
 IMAGE_WIDTH = 1920   # RTSP stream resolution
 IMAGE_HEIGHT = 1080  # RTSP stream resolution
-IMAGE_PATH = '/tmp/feed_monitor_current.jpg'  # Temporary storage (overwritten each cycle)
+IMAGE_PATH = '/tmp/feed_monitor_current.jpg'  # Web UI still capture path (the monitor decodes frames in memory)
+RTSP_URL = 'rtsp://localhost:8554/csi_camera'  # MediaMTX stream the monitor samples
+RTSP_TIMEOUT_SECONDS = 10  # Give up on a capture attempt after this long
+FFMPEG_H264_DECODER = 'h264_v4l2m2m'  # ffmpeg fallback decoder (VideoCore HW); None = software
+DEBUG_SAVE_FRAMES = False  # Write each analyzed frame to DEBUG_FRAME_PATH (SD-card I/O - leave off)
+DEBUG_FRAME_PATH = '/tmp/feed_monitor_debug.jpg'
 
 # Capture Timing
 CAPTURE_INTERVAL_SECONDS = 60   # 1 minute (chickens eat quickly - need frequent monitoring)
@@ -49,6 +67,13 @@ FEED_LEVEL_FULL_Y = 59       # Feed surface when jar is FULL (scaled from traini
 FEED_LEVEL_EMPTY_Y = 196     # Feed surface when jar is EMPTY (scaled from training)
 # Y-range: 137 pixels (adequate for gradient detection)
 
+# Derived per-frame indexing, computed once at import. Keep these as
+# expressions: the web UI rewrites only the literal values above.
+ROI_SLICE = (slice(ROI_Y, ROI_Y + ROI_HEIGHT), slice(ROI_X, ROI_X + ROI_WIDTH))
+FEED_SEARCH_SLICE = slice(max(FEED_LEVEL_FULL_Y + 5, 0),         # Rows scanned for the feed
+                          min(FEED_LEVEL_EMPTY_Y - 5, ROI_HEIGHT))  # surface, skipping marker lines
+FEED_LEVEL_RANGE = FEED_LEVEL_EMPTY_Y - FEED_LEVEL_FULL_Y
+
 # Feed Color Detection (HSV color space)
 # Calibrate these values based on your feed color
 # Format: [Hue, Saturation, Value]
@@ -60,11 +85,23 @@ FEED_LEVEL_EMPTY_Y = 196     # Feed surface when jar is EMPTY (scaled from train
 FEED_COLOR_HSV_MIN = [0, 160, 100]    # High saturation, allow darker values (feed is darker than empty space)
 FEED_COLOR_HSV_MAX = [180, 255, 200]  # Cap brightness at 200 to exclude brighter empty regions
 
+# Same bounds as contiguous uint8 arrays, built once so cv2.inRange gets a
+# ready Mat header each frame. Read-only to catch accidental mutation.
+FEED_COLOR_HSV_MIN_ARR = np.array(FEED_COLOR_HSV_MIN, dtype=np.uint8)
+FEED_COLOR_HSV_MAX_ARR = np.array(FEED_COLOR_HSV_MAX, dtype=np.uint8)
+FEED_COLOR_HSV_MIN_ARR.flags.writeable = False
+FEED_COLOR_HSV_MAX_ARR.flags.writeable = False
+
 # Feed Level Detection Parameters
 DENSITY_THRESHOLD = 0.15    # Minimum 15% of row must be feed-colored to count as "dense"
                             # Gradient detection finds transition point; threshold validates it's real feed
                             # May need adjustment for overhead view and higher resolution
 
+# Same threshold as a pixel count, so rows are compared without dividing:
+# count >= DENSITY_MIN_PIXELS  <=>  count / ROI_WIDTH >= DENSITY_THRESHOLD
+# (rounded first: 0.15 * 140 is 21.000000000000004 in floating point)
+DENSITY_MIN_PIXELS = math.ceil(round(DENSITY_THRESHOLD * ROI_WIDTH, 6))
+
 GRADIENT_WINDOW_SIZE = 8    # Row window for gradient smoothing (increased from 5 for higher resolution)
 
 # Feed Level Thresholds (percentage of jar filled)
@@ -72,10 +109,65 @@ LEVEL_THRESHOLD_FULL = 80    # Above this = FULL
 LEVEL_THRESHOLD_MEDIUM = 40  # Above this = MEDIUM
 LEVEL_THRESHOLD_LOW = 10     # Above this = LOW, below = EMPTY
 
+# Read-only view of the thresholds, highest first (first match wins)
+LEVEL_THRESHOLDS = types.MappingProxyType({
+    'FULL': LEVEL_THRESHOLD_FULL,
+    'MEDIUM': LEVEL_THRESHOLD_MEDIUM,
+    'LOW': LEVEL_THRESHOLD_LOW,
+})
+
 # Image Quality Thresholds
 BLUR_THRESHOLD = 70.0       # Minimum Laplacian variance (lowered for CSI stream - typical: 78-85)
 BRIGHTNESS_MIN = 40         # Minimum average brightness (0-255)
 BRIGHTNESS_MAX = 220        # Maximum average brightness (0-255)
+BRIGHTNESS_SAMPLE_STRIDE = 8  # Brightness mean over every 8th row/column (1/64 of the pixels)
+BLUR_ROI_ONLY = False       # Run blur/brightness checks on ROI_SLICE only (~60x fewer pixels).
+                            # BLUR_THRESHOLD above was calibrated on full frames - recalibrate
+                            # it from ROI Laplacian variance before enabling.
+
+# Per-frame thresholds bundled into one frozen, slotted object so the monitor
+# can bind it to a local once and read fields by slot instead of global lookups
+# (__slots__ by hand: dataclass(slots=True) needs Python 3.10, README promises 3.8+)
+@dataclasses.dataclass(frozen=True)
+class FeedDetectionConfig:
+    __slots__ = ('density_threshold', 'density_min_pixels', 'gradient_window',
+                 'level_full', 'level_medium', 'level_low',
+                 'blur_threshold', 'brightness_min', 'brightness_max')
+
+    density_threshold: float
+    density_min_pixels: int
+    gradient_window: int
+    level_full: int
+    level_medium: int
+    level_low: int
+    blur_threshold: float
+    brightness_min: int
+    brightness_max: int
+
+
+CFG = FeedDetectionConfig(
+    density_threshold=DENSITY_THRESHOLD,
+    density_min_pixels=DENSITY_MIN_PIXELS,
+    gradient_window=GRADIENT_WINDOW_SIZE,
+    level_full=LEVEL_THRESHOLD_FULL,
+    level_medium=LEVEL_THRESHOLD_MEDIUM,
+    level_low=LEVEL_THRESHOLD_LOW,
+    blur_threshold=BLUR_THRESHOLD,
+    brightness_min=BRIGHTNESS_MIN,
+    brightness_max=BRIGHTNESS_MAX,
+)
+
+# Feed-surface row (ROI coordinates) -> fill percentage and level index into
+# LEVEL_NAMES, precomputed for every ROI row so the CV path does two lookups
+# instead of the percentage math and threshold if/elif chain
+LEVEL_NAMES = tuple(sys.intern(name) for name in ('EMPTY', 'LOW', 'MEDIUM', 'FULL'))
+_rows = np.arange(ROI_HEIGHT)
+LEVEL_PCT_LUT = np.clip(100 - (_rows - FEED_LEVEL_FULL_Y) / FEED_LEVEL_RANGE * 100, 0, 100)
+LEVEL_LABEL_LUT = ((LEVEL_PCT_LUT >= LEVEL_THRESHOLD_LOW).astype(np.uint8)
+                   + (LEVEL_PCT_LUT >= LEVEL_THRESHOLD_MEDIUM)
+                   + (LEVEL_PCT_LUT >= LEVEL_THRESHOLD_FULL))
+LEVEL_PCT_LUT.flags.writeable = False
+LEVEL_LABEL_LUT.flags.writeable = False
 
 # Calibration Metadata
 CALIBRATION_DATE = '2025-11-23'  # Fixed Y-coordinates to match training dataset
@@ -26,6 +26,7 @@ Dependencies:
 - numpy
 - pytz (for timezone support)
 - rpicam-apps (for CSI camera capture)
+- orjson (optional, faster MQTT payload serialization)
 
 Hardware Requirements:
 - Raspberry Pi 3B+ or newer
@@ -44,10 +45,29 @@ import time
 import json
 import os
 import subprocess
+import sys
+from collections import deque
 from datetime import datetime
 import pytz
-import tensorflow as tf
-from PIL import Image
+
+# Optional fast JSON encoder (orjson); falls back to stdlib json
+try:
+    import orjson
+
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes (numpy scalars included)."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Prefer the standalone TFLite runtime (XNNPACK CPU kernels, no full TF import)
+try:
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    import tensorflow as tf
+    Interpreter = tf.lite.Interpreter
 
 # Load configuration
 try:
@@ -56,16 +76,25 @@ except ImportError:
     print("ERROR: feed_config.py not found. Please run calibrate_feed_monitor.py first.")
     exit(1)
 
+# OpenCV's FFmpeg reader: pull RTSP over TCP like the ffmpeg fallback does
+os.environ.setdefault('OPENCV_FFMPEG_CAPTURE_OPTIONS', 'rtsp_transport;tcp')
+
 # Global MQTT client
 mqtt_client = None
 
 # Feed level history for trend analysis
-feed_history = []
 FEED_HISTORY_SIZE = 4  # Keep last 4 readings (1 hour at 15min intervals)
+feed_history = deque(maxlen=FEED_HISTORY_SIZE)
 
 # Last valid feed reading (retained during lights out)
 last_valid_reading = None
 
+# Reusable single-channel buffers for measure_feed_level (ROI size is fixed);
+# OpenCV writes into these via dst= instead of allocating per call
+_value_buf = np.empty((ROI_HEIGHT, ROI_WIDTH), dtype=np.uint8)
+_mask_buf = np.empty((ROI_HEIGHT, ROI_WIDTH), dtype=np.uint8)
+_edge_buf = np.empty((ROI_HEIGHT, ROI_WIDTH), dtype=np.uint8)
+
 # Timezone for lights schedule
 ET = pytz.timezone('America/New_York')
 
@@ -78,9 +107,47 @@ LIGHTS_OFF_MINUTE = 0
 # ML Model Configuration
 TFLITE_MODEL_PATH = '/opt/beeperKeeper/models/feed_model.tflite'
 ML_INPUT_SIZE = (224, 224)  # MobileNetV2 input size
+ML_NUM_THREADS = os.cpu_count() or 4  # Pi 3B+: 4 Cortex-A53 cores, idle during inference
+
+# ML gating: skip inference when the classical CV methods already agree
+# clearly. ML still runs whenever they disagree, are unsure, land near a
+# level threshold, or ML_FORCE_EVERY_N_CYCLES cycles have passed (drift check)
+ML_GATE_ENABLED = True
+ML_GATE_MAX_SPREAD_PX = 8       # CV surface estimates must agree within this many rows
+ML_GATE_MIN_CONFIDENCE = 70     # Minimum CV confidence (0-100)
+ML_GATE_THRESHOLD_MARGIN = 5    # Percentage points of clearance from any level threshold
+ML_FORCE_EVERY_N_CYCLES = 60    # At 1-minute captures: ML at least hourly
+
+# Cycles since the last ML inference
+cycles_since_ml = 0
+
+# Static-scene cache: when the ROI thumbnail barely differs from the frame
+# behind the last fresh reading, republish that reading instead of re-measuring
+FRAME_CACHE_THUMB_SIZE = (32, 32)
+FRAME_CACHE_MAX_DIFF = 2.0        # Mean absolute gray-level difference (0-255)
+FRAME_CACHE_MAX_AGE = 15 * 60     # Re-measure at least this often (seconds)
+
+# (thumbnail, feed_data, monotonic time) of the last fresh reading
+last_frame_cache = None
+
+# ROI-alignment alert payload with everything but message/timestamp pre-encoded
+# (%s takes the JSON-encoded message, %d the epoch seconds)
+ALIGNMENT_ALERT_TEMPLATE = (b'{"alert_type":"roi_alignment_failed","severity":"warning",'
+                            b'"message":%s,"timestamp":%d,'
+                            b'"sensor_type":"camera","location":"raspberry_pi"}')
 
 # Global TFLite interpreter
 tflite_interpreter = None
+# Input/output tensor details, cached once the model is loaded
+tflite_input_detail = None
+tflite_output_detail = None
+# Callable returning a writable view of the input tensor buffer. Only the
+# callable is kept: invoke() refuses to run while a view is still referenced
+tflite_input_tensor = None
+# float32 scratch for quantizing the input of integer models (None for float models)
+tflite_scratch = None
+# uint8 RGB buffer the ROI is resized into each cycle (ML_INPUT_SIZE, allocated once)
+tflite_resize_buf = None
 
 def get_current_lights_state():
     """
@@ -118,7 +185,8 @@ def init_tflite_model():
     Returns:
         bool: True if successful, False otherwise
     """
-    global tflite_interpreter
+    global tflite_interpreter, tflite_input_detail, tflite_output_detail, tflite_input_tensor, tflite_scratch
+    global tflite_resize_buf
 
     try:
         if not os.path.exists(TFLITE_MODEL_PATH):
@@ -126,16 +194,23 @@ def init_tflite_model():
             return False
 
         # Load TFLite model
-        tflite_interpreter = tf.lite.Interpreter(model_path=TFLITE_MODEL_PATH)
+        # Works with both float32 and full-integer (int8/uint8) quantized models
+        tflite_interpreter = Interpreter(model_path=TFLITE_MODEL_PATH, num_threads=ML_NUM_THREADS)
         tflite_interpreter.allocate_tensors()
 
         # Get input/output details
         input_details = tflite_interpreter.get_input_details()
         output_details = tflite_interpreter.get_output_details()
+        tflite_input_detail = input_details[0]
+        tflite_output_detail = output_details[0]
+        tflite_input_tensor = tflite_interpreter.tensor(tflite_input_detail['index'])
+        if tflite_input_detail['dtype'] != np.float32:
+            tflite_scratch = np.empty(tuple(tflite_input_detail['shape'][1:]), dtype=np.float32)
+        tflite_resize_buf = np.empty((ML_INPUT_SIZE[1], ML_INPUT_SIZE[0], 3), dtype=np.uint8)
 
-        print(f"✓ TFLite model loaded: {TFLITE_MODEL_PATH}")
-        print(f"  Input shape: {input_details[0]['shape']}")
-        print(f"  Output shape: {output_details[0]['shape']}")
+        print(f"✓ TFLite model loaded: {TFLITE_MODEL_PATH} ({ML_NUM_THREADS} threads)")
+        print(f"  Input shape: {input_details[0]['shape']} ({input_details[0]['dtype'].__name__})")
+        print(f"  Output shape: {output_details[0]['shape']} ({output_details[0]['dtype'].__name__})")
 
         return True
 
@@ -143,12 +218,13 @@ def init_tflite_model():
         print(f"✗ Failed to initialize TFLite model: {e}")
         return False
 
-def predict_feed_level_ml(image):
+def predict_feed_level_ml(image, ctx=None):
     """
     Predict feed level using ML model (TFLite inference).
 
     Args:
         image: Full OpenCV BGR image (1920x1080)
+        ctx: Optional ROI context from build_roi_context (reuses its ROI copy)
 
     Returns:
         dict: Prediction results with percentage and confidence
@@ -173,37 +249,42 @@ def predict_feed_level_ml(image):
             }
 
         # Extract ROI from full image
-        x, y, w, h = ROI_X, ROI_Y, ROI_WIDTH, ROI_HEIGHT
-        roi = image[y:y+h, x:x+w]
-
-        # Convert BGR to RGB
-        roi_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
-
-        # Resize to 224x224 for MobileNetV2
-        roi_resized = cv2.resize(roi_rgb, ML_INPUT_SIZE, interpolation=cv2.INTER_LINEAR)
-
-        # Convert to PIL Image and back to numpy (ensures proper format)
-        pil_image = Image.fromarray(roi_resized)
-        img_array = np.array(pil_image, dtype=np.float32)
-
-        # Normalize to [0, 1]
-        img_array = img_array / 255.0
-
-        # Add batch dimension: (224, 224, 3) -> (1, 224, 224, 3)
-        img_array = np.expand_dims(img_array, axis=0)
+        roi = ctx['roi'] if ctx is not None else image[ROI_SLICE]
+
+        # Resize to 224x224 for MobileNetV2 into the preallocated buffer, then convert
+        # BGR to RGB in place on the small image (same result as converting first -
+        # channels resize independently)
+        roi_resized = cv2.resize(roi, ML_INPUT_SIZE, dst=tflite_resize_buf,
+                                 interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(roi_resized, cv2.COLOR_BGR2RGB, dst=roi_resized)
+
+        # Normalize to [0, 1] and write straight into the (1, 224, 224, 3) input
+        # tensor (no intermediate arrays, no set_tensor copy); the view is
+        # dropped before invoke()
+        input_dtype = tflite_input_detail['dtype']
+        if input_dtype == np.float32:
+            np.multiply(roi_resized, np.float32(1.0 / 255.0), out=tflite_input_tensor()[0])
+        else:
+            # Quantized models take int8/uint8: q = (x / 255) / scale + zero_point
+            scale, zero_point = tflite_input_detail['quantization']
+            info = np.iinfo(input_dtype)
+            np.multiply(roi_resized, np.float32(1.0 / (255.0 * scale)), out=tflite_scratch)
+            np.add(tflite_scratch, zero_point, out=tflite_scratch)
+            np.rint(tflite_scratch, out=tflite_scratch)
+            np.clip(tflite_scratch, info.min, info.max, out=tflite_scratch)
+            tflite_input_tensor()[0] = tflite_scratch
 
         # Run inference
-        input_details = tflite_interpreter.get_input_details()
-        output_details = tflite_interpreter.get_output_details()
-
-        tflite_interpreter.set_tensor(input_details[0]['index'], img_array)
         tflite_interpreter.invoke()
 
-        # Get prediction
-        prediction = tflite_interpreter.get_tensor(output_details[0]['index'])
+        # Get prediction (dequantize integer outputs back to [0, 1])
+        prediction = float(tflite_interpreter.get_tensor(tflite_output_detail['index'])[0][0])
+        if tflite_output_detail['dtype'] != np.float32:
+            scale, zero_point = tflite_output_detail['quantization']
+            prediction = (prediction - zero_point) * scale
 
         # Denormalize: model outputs [0, 1], convert to [0, 100]
-        percentage = float(prediction[0][0] * 100.0)
+        percentage = prediction * 100.0
 
         # Clamp to valid range
         percentage = max(0.0, min(100.0, percentage))
@@ -270,96 +351,171 @@ def init_mqtt():
 
     return False
 
-def capture_image():
-    """
-    Capture still image from CSI camera RTSP stream without stopping MediaMTX.
-
-    Extracts a single frame from the live RTSP stream using ffmpeg.
-    This avoids disrupting the live stream and eliminates the need to stop/restart MediaMTX.
-    The captured frame is 1920x1080 (stream resolution) instead of 2592x1944,
-    but this is sufficient for feed level detection and much faster.
+def _capture_frame_opencv():
+    """Grab one frame in-process with OpenCV's FFmpeg backend, or None"""
+    # Open per capture: an idle RTSP session would queue minutes-old frames
+    params = []
+    if hasattr(cv2, 'CAP_PROP_OPEN_TIMEOUT_MSEC'):  # OpenCV >= 4.6
+        params = [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, RTSP_TIMEOUT_SECONDS * 1000,
+                  cv2.CAP_PROP_READ_TIMEOUT_MSEC, RTSP_TIMEOUT_SECONDS * 1000]
+    cap = cv2.VideoCapture(RTSP_URL, cv2.CAP_FFMPEG, params)
+    try:
+        if not cap.isOpened():
+            return None
+        ret, image = cap.read()
+        return image if ret else None
+    finally:
+        cap.release()
 
-    Returns:
-        numpy.ndarray: Captured image as OpenCV BGR array, or None on failure
-    """
+def _capture_frame_ffmpeg(decoder=FFMPEG_H264_DECODER):
+    """Grab one frame through an ffmpeg subprocess (raw BGR over a pipe), or None"""
     try:
-        # Capture single frame from RTSP stream using ffmpeg
-        cmd = [
-            'ffmpeg',
-            '-rtsp_transport', 'tcp',
-            '-i', 'rtsp://localhost:8554/csi_camera',
+        # Capture single frame from RTSP stream using ffmpeg, raw bgr24 to stdout
+        # (no JPEG round trip, nothing is written to disk). The decoder option
+        # selects the Pi's VideoCore H.264 block instead of software decode.
+        cmd = ['ffmpeg', '-rtsp_transport', 'tcp']
+        if decoder:
+            cmd += ['-c:v', decoder]
+        cmd += [
+            '-i', RTSP_URL,
             '-frames:v', '1',
-            '-q:v', '2',
-            '-y',
-            IMAGE_PATH
+            '-f', 'rawvideo',
+            '-pix_fmt', 'bgr24',
+            'pipe:1'
         ]
 
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
-            timeout=10
+            timeout=RTSP_TIMEOUT_SECONDS
         )
 
         if result.returncode != 0:
-            print(f"✗ RTSP frame capture failed: {result.stderr[-200:]}")  # Last 200 chars
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            if decoder:
+                # Hardware decoder missing/busy - retry once with software decode
+                print(f"⚠️  ffmpeg {decoder} decode failed, retrying in software")
+                return _capture_frame_ffmpeg(decoder=None)
+            print(f"✗ RTSP frame capture failed: {stderr[-200:]}")  # Last 200 chars
             return None
 
-        # Load image with OpenCV
-        if not os.path.exists(IMAGE_PATH):
-            print(f"✗ Image file not created: {IMAGE_PATH}")
+        frame_bytes = IMAGE_WIDTH * IMAGE_HEIGHT * 3
+        if len(result.stdout) != frame_bytes:
+            print(f"✗ ffmpeg returned {len(result.stdout)} bytes, expected {frame_bytes} "
+                  f"({IMAGE_WIDTH}x{IMAGE_HEIGHT} bgr24)")
             return None
 
-        image = cv2.imread(IMAGE_PATH)
+        # frombuffer over bytes is read-only; copy once so callers get a normal array
+        return np.frombuffer(result.stdout, dtype=np.uint8).reshape(IMAGE_HEIGHT, IMAGE_WIDTH, 3).copy()
+
+    except subprocess.TimeoutExpired:
+        print(f"✗ RTSP capture timed out")
+        return None
+
+def capture_image():
+    """
+    Capture still image from CSI camera RTSP stream without stopping MediaMTX.
+
+    Extracts a single frame from the live RTSP stream, decoding it in-process
+    with OpenCV (no fork, no JPEG re-encode). Falls back to an ffmpeg
+    subprocess if OpenCV was built without FFmpeg or the grab fails.
+    This avoids disrupting the live stream and eliminates the need to stop/restart MediaMTX.
+    The captured frame is 1920x1080 (stream resolution) instead of 2592x1944,
+    but this is sufficient for feed level detection and much faster.
+
+    Returns:
+        numpy.ndarray: Captured image as OpenCV BGR array, or None on failure
+    """
+    try:
+        image = _capture_frame_opencv()
+        if image is None:
+            print("⚠️  In-process RTSP grab failed, falling back to ffmpeg")
+            image = _capture_frame_ffmpeg()
         if image is None:
-            print(f"✗ Could not load image: {IMAGE_PATH}")
             return None
 
         print(f"✓ RTSP frame captured: {image.shape[1]}x{image.shape[0]}")
         return image
 
-    except subprocess.TimeoutExpired:
-        print(f"✗ RTSP capture timed out")
-        return None
     except Exception as e:
         print(f"✗ Image capture failed: {e}")
         return None
 
-def validate_image_quality(image):
+def build_roi_context(image):
+    """
+    Crop the ROI and derive its grayscale view once per cycle.
+
+    The quality, jar and alignment checks all work on the same ROI gray
+    image, so it is converted once here and handed to each of them.
+
+    Args:
+        image: Full OpenCV BGR image
+
+    Returns:
+        dict: {'roi': contiguous BGR ROI, 'gray': ROI grayscale, 'mean_brightness': float}
+    """
+    # Copy the ROI out of the 1920-wide frame once (~100 KB, fits in L2) so
+    # every later pass streams contiguous rows instead of striding 5760 B/row
+    roi = np.ascontiguousarray(image[ROI_SLICE])
+    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    return {
+        'roi': roi,
+        'gray': gray,
+        'mean_brightness': float(np.mean(gray))
+    }
+
+def laplacian_variance(gray):
+    """
+    Variance of the Laplacian of an 8-bit grayscale image (focus/texture measure).
+
+    The 3x3 Laplacian of uint8 input stays within +/-1020, so it is computed
+    in int16 (2 bytes/pixel instead of 8 for CV_64F); cv2.meanStdDev then
+    accumulates in double precision without a float copy of the buffer.
+    """
+    _, stddev = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    return float(stddev[0, 0]) ** 2
+
+def validate_image_quality(image, ctx=None):
     """
     Validate image quality using blur detection and brightness analysis.
 
     Args:
         image: OpenCV BGR image array
+        ctx: Optional ROI context from build_roi_context (reused when BLUR_ROI_ONLY)
 
     Returns:
         tuple: (is_valid, quality_score, blur_score, brightness)
     """
+    cfg = CFG
     try:
-        # Convert to grayscale for analysis
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale for analysis (jar ROI only if configured)
+        if BLUR_ROI_ONLY:
+            gray = (ctx or build_roi_context(image))['gray']
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
         # Blur detection using Laplacian variance
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+        laplacian_var = laplacian_variance(gray)
         blur_score = round(laplacian_var, 2)
 
-        # Brightness analysis
-        brightness = round(np.mean(gray), 2)
+        # Brightness analysis (strided sample is plenty for a sanity gate)
+        stride = BRIGHTNESS_SAMPLE_STRIDE
+        brightness = round(np.mean(gray[::stride, ::stride]), 2)
 
         # Quality validation
-        is_blurry = blur_score < BLUR_THRESHOLD
-        is_too_dark = brightness < BRIGHTNESS_MIN
-        is_too_bright = brightness > BRIGHTNESS_MAX
+        is_blurry = blur_score < cfg.blur_threshold
+        is_too_dark = brightness < cfg.brightness_min
+        is_too_bright = brightness > cfg.brightness_max
 
         is_valid = not (is_blurry or is_too_dark or is_too_bright)
 
         # Calculate overall quality score (0-100)
-        blur_quality = min(100, (blur_score / BLUR_THRESHOLD) * 100) if BLUR_THRESHOLD > 0 else 100
+        blur_quality = min(100, (blur_score / cfg.blur_threshold) * 100) if cfg.blur_threshold > 0 else 100
         brightness_quality = 100
         if is_too_dark:
-            brightness_quality = (brightness / BRIGHTNESS_MIN) * 100
+            brightness_quality = (brightness / cfg.brightness_min) * 100
         elif is_too_bright:
-            brightness_quality = (1 - ((brightness - BRIGHTNESS_MAX) / (255 - BRIGHTNESS_MAX))) * 100
+            brightness_quality = (1 - ((brightness - cfg.brightness_max) / (255 - cfg.brightness_max))) * 100
 
         quality_score = round((blur_quality + brightness_quality) / 2, 1)
 
@@ -369,7 +525,7 @@ def validate_image_quality(image):
         print(f"✗ Image quality validation failed: {e}")
         return False, 0, 0, 0
 
-def detect_jar(image):
+def detect_jar(image, ctx=None):
     """
     Detect glass jar feeder in image using contour analysis.
 
@@ -378,15 +534,16 @@ def detect_jar(image):
 
     Args:
         image: OpenCV BGR image array
+        ctx: Optional ROI context from build_roi_context
 
     Returns:
         tuple: (jar_detected, jar_contour, jar_roi)
                jar_roi is (x, y, w, h) of bounding rectangle
     """
     try:
-        # Extract ROI from full image
-        x, y, w, h = ROI_X, ROI_Y, ROI_WIDTH, ROI_HEIGHT
-        roi = image[y:y+h, x:x+w]
+        if ctx is None:
+            ctx = build_roi_context(image)
+        w, h = ROI_WIDTH, ROI_HEIGHT
 
         # Since ROI is already focused on jar, use the full ROI as jar area
         # This is more reliable than edge detection which can fail with glass reflections
@@ -394,8 +551,7 @@ def detect_jar(image):
 
         # Simple validation: check if image has reasonable content
         # (not all black/white, which would indicate camera failure)
-        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-        mean_brightness = np.mean(gray)
+        mean_brightness = ctx['mean_brightness']
 
         # If brightness is reasonable, assume jar is present
         if 20 < mean_brightness < 240:
@@ -407,7 +563,7 @@ def detect_jar(image):
         print(f"✗ Jar detection failed: {e}")
         return False, None, None
 
-def validate_roi_alignment(image):
+def validate_roi_alignment(image, ctx=None):
     """
     Validate that ROI contains reasonable image content to detect misalignment.
 
@@ -421,25 +577,26 @@ def validate_roi_alignment(image):
 
     Args:
         image: Full OpenCV BGR image
+        ctx: Optional ROI context from build_roi_context
 
     Returns:
         tuple: (is_valid: bool, message: str)
     """
     try:
-        # Extract ROI
-        x, y, w, h = ROI_X, ROI_Y, ROI_WIDTH, ROI_HEIGHT
-        roi = image[y:y+h, x:x+w]
-        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+        if ctx is None:
+            ctx = build_roi_context(image)
+        w, h = ROI_WIDTH, ROI_HEIGHT
+        gray = ctx['gray']
 
         # Check 1: Brightness should be reasonable
-        mean_brightness = np.mean(gray)
+        mean_brightness = ctx['mean_brightness']
         if mean_brightness < 20:
             return False, f'ROI too dark ({mean_brightness:.1f}) - possible misalignment'
         if mean_brightness > 240:
             return False, f'ROI too bright ({mean_brightness:.1f}) - possible glare/misalignment'
 
         # Check 2: Should have texture (not uniform)
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+        laplacian_var = laplacian_variance(gray)
         if laplacian_var < 10:
             return False, f'No texture detected (var={laplacian_var:.1f}) - ROI may be off-target'
 
@@ -456,7 +613,19 @@ def validate_roi_alignment(image):
     except Exception as e:
         return False, f'Validation error: {e}'
 
-def measure_feed_level(image):
+def count_row_pixels(mask):
+    """
+    Count set pixels in each row of a 0/255 mask (inRange / Canny output).
+
+    cv2.reduce sums rows with OpenCV's NEON kernels; every set pixel is 255,
+    so the integer sum divides back to an exact count.
+
+    Returns:
+        numpy.ndarray: int32 count per row
+    """
+    return cv2.reduce(mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+
+def measure_feed_level(image, ctx=None):
     """
     Measure feed level in jar using top-down row scanning.
 
@@ -469,17 +638,19 @@ def measure_feed_level(image):
 
     Args:
         image: OpenCV BGR image array
+        ctx: Optional ROI context from build_roi_context
 
     Returns:
         dict: Feed level data including percentage, classification, and raw measurements
     """
+    cfg = CFG
     try:
-        # Extract ROI from full image
-        x, y, w, h = ROI_X, ROI_Y, ROI_WIDTH, ROI_HEIGHT
-        roi = image[y:y+h, x:x+w]
+        if ctx is None:
+            ctx = build_roi_context(image)
+        roi = ctx['roi']
 
         # Detect jar
-        jar_detected, jar_contour, jar_roi = detect_jar(image)
+        jar_detected, jar_contour, jar_roi = detect_jar(image, ctx)
 
         if not jar_detected:
             return {
@@ -496,9 +667,7 @@ def measure_feed_level(image):
         hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
 
         # Create mask for feed color (configurable HSV range)
-        lower_bound = np.array(FEED_COLOR_HSV_MIN)
-        upper_bound = np.array(FEED_COLOR_HSV_MAX)
-        feed_mask = cv2.inRange(hsv, lower_bound, upper_bound)
+        feed_mask = cv2.inRange(hsv, FEED_COLOR_HSV_MIN_ARR, FEED_COLOR_HSV_MAX_ARR, dst=_mask_buf)
 
         # TOP-DOWN SCANNING: Multi-method detection for accuracy
         # Uses brightness gradient + HSV color + edge detection with cross-validation
@@ -506,77 +675,67 @@ def measure_feed_level(image):
         roi_height, roi_width = feed_mask.shape
 
         # ========== METHOD 1: HSV Color-based Gradient (original) ==========
-        densities = []
         # FIXED: Scan from FULL_Y (top) to EMPTY_Y (bottom) - correct direction!
-        scan_start = max(FEED_LEVEL_FULL_Y + 5, 0)  # Skip marker line area
-        scan_end = min(FEED_LEVEL_EMPTY_Y - 5, roi_height)  # Skip marker line area
-
-        for row_y in range(scan_start, scan_end):
-            row_pixels = np.sum(feed_mask[row_y, :] > 0)
-            row_density = row_pixels / roi_width
-            densities.append((row_y, row_density))
+        scan_start = FEED_SEARCH_SLICE.start  # Skip marker line areas
+        # Feed-colored pixel count per scanned row, one reduction over the band
+        row_counts = count_row_pixels(feed_mask[FEED_SEARCH_SLICE, :])
 
         max_gradient_hsv = 0
         max_gradient_y_hsv = -1
-        window_size = GRADIENT_WINDOW_SIZE
-
-        if len(densities) > window_size:
-            for i in range(len(densities) - window_size):
-                y_start, density_start = densities[i]
-                y_end, density_end = densities[i + window_size]
-                gradient = (density_end - density_start) / window_size
+        window_size = cfg.gradient_window
 
-                if gradient > max_gradient_hsv:
-                    max_gradient_hsv = gradient
-                    max_gradient_y_hsv = y_end
+        if len(row_counts) > window_size:
+            gradient_scale = window_size * roi_width  # counts -> density per row
+            gradients = (row_counts[window_size:] - row_counts[:-window_size]) / gradient_scale
+            # argmax returns the first (topmost) peak, same as a strict > scan
+            i = int(np.argmax(gradients))
+            if gradients[i] > 0:
+                max_gradient_hsv = float(gradients[i])
+                max_gradient_y_hsv = scan_start + i + window_size
 
         # ========== METHOD 2: Brightness Gradient (Value channel) ==========
-        value_channel = hsv[:, :, 2]
-        brightness_rows = []
+        # Contiguous copy of V; also serves as the grayscale input for Canny below
+        value_channel = cv2.extractChannel(hsv, 2, dst=_value_buf)
 
-        for row_y in range(scan_start, scan_end):
-            # Sample center 80% of row to avoid jar edges
-            mid_start = int(roi_width * 0.1)
-            mid_end = int(roi_width * 0.9)
-            row_brightness = np.mean(value_channel[row_y, mid_start:mid_end])
-            brightness_rows.append((row_y, row_brightness))
+        # Sample center 80% of each row to avoid jar edges
+        mid_start = int(roi_width * 0.1)
+        mid_end = int(roi_width * 0.9)
+        # float32 accumulation is exact here (row sums of uint8 stay far below 2**24)
+        brightness_rows = value_channel[FEED_SEARCH_SLICE, mid_start:mid_end].mean(axis=1, dtype=np.float32)
 
         max_gradient_brightness = 0
         max_gradient_y_brightness = -1
 
         if len(brightness_rows) > window_size:
-            for i in range(len(brightness_rows) - window_size):
-                y_start, brightness_start = brightness_rows[i]
-                y_end, brightness_end = brightness_rows[i + window_size]
-                # Look for brightness DROP (feed is darker than empty space)
-                gradient = abs(brightness_start - brightness_end) / window_size
-
-                if gradient > max_gradient_brightness and gradient > 5.0:  # Minimum threshold
-                    max_gradient_brightness = gradient
-                    max_gradient_y_brightness = y_end
+            # Look for brightness DROP (feed is darker than empty space)
+            gradients = np.abs(brightness_rows[:-window_size] - brightness_rows[window_size:]) / window_size
+            i = int(np.argmax(gradients))
+            if gradients[i] > 5.0:  # Minimum threshold
+                max_gradient_brightness = float(gradients[i])
+                max_gradient_y_brightness = scan_start + i + window_size
 
         # ========== METHOD 3: Edge Detection ==========
-        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 30, 100)
+        # V (max of B, G, R) tracks brightness closely enough for edges and
+        # saves a second full color conversion of the ROI
+        edges = cv2.Canny(value_channel, 30, 100, edges=_edge_buf)
 
-        edge_counts = []
-        for row_y in range(scan_start, scan_end):
-            edge_count = np.sum(edges[row_y, :] > 0)
-            edge_counts.append((row_y, edge_count))
+        edge_counts = count_row_pixels(edges[FEED_SEARCH_SLICE, :])
 
         # Find row with most edges (likely the feed surface)
         max_edges = 0
         max_edges_y = -1
-        for y, count in edge_counts:
-            if count > max_edges and count > 5:  # Minimum edge threshold
-                max_edges = count
-                max_edges_y = y
+        if len(edge_counts):
+            i = int(np.argmax(edge_counts))
+            if edge_counts[i] > 5:  # Minimum edge threshold
+                max_edges = int(edge_counts[i])
+                max_edges_y = scan_start + i
 
         # ========== CROSS-VALIDATION: Combine methods ==========
         candidates = []
+        surface_spread = -1  # Row spread between agreeing methods (-1 = no consensus)
         if max_gradient_y_hsv > 0:
-            surface_density = next((d for y, d in densities if y == max_gradient_y_hsv), 0)
-            if surface_density >= DENSITY_THRESHOLD:
+            surface_count = row_counts[max_gradient_y_hsv - scan_start]
+            if surface_count >= cfg.density_min_pixels:
                 candidates.append(('HSV', max_gradient_y_hsv, max_gradient_hsv))
 
         if max_gradient_y_brightness > 0:
@@ -589,6 +748,7 @@ def measure_feed_level(image):
             # If multiple methods agree (within 15 pixels), use average
             y_values = [y for _, y, _ in candidates]
             if max(y_values) - min(y_values) <= 15:
+                surface_spread = max(y_values) - min(y_values)
                 feed_surface_y = int(np.mean(y_values))
                 methods = ', '.join([m for m, _, _ in candidates])
                 print(f"  DEBUG: Feed surface at Y={feed_surface_y} (methods: {methods} - CONSENSUS)")
@@ -607,27 +767,17 @@ def measure_feed_level(image):
         else:
             print(f"  DEBUG: No significant feed surface detected by any method")
 
-        # Calculate feed level percentage based on Y position
+        # Feed level percentage and classification based on Y position
         if feed_surface_y >= 0:
-            # Calculate percentage: 100% at FULL_Y=50 (top), 0% at EMPTY_Y=174 (bottom)
+            # 100% at FULL_Y (top), 0% at EMPTY_Y (bottom), clamped; precomputed per row
             # Y-axis increases downward, so smaller Y = more full
-            y_range = FEED_LEVEL_EMPTY_Y - FEED_LEVEL_FULL_Y  # 174 - 50 = 124 pixels
-            y_offset = feed_surface_y - FEED_LEVEL_FULL_Y      # Distance from FULL line
-            level_percentage = max(0, min(100, 100 - (y_offset / y_range * 100)))
+            level_percentage = float(LEVEL_PCT_LUT[feed_surface_y])
+            level_classification = LEVEL_NAMES[LEVEL_LABEL_LUT[feed_surface_y]]
         else:
             # No feed detected - jar is empty
             level_percentage = 0
-            feed_surface_y = FEED_LEVEL_EMPTY_Y  # Report empty position
-
-        # Classify feed level
-        if level_percentage >= LEVEL_THRESHOLD_FULL:
-            level_classification = 'FULL'
-        elif level_percentage >= LEVEL_THRESHOLD_MEDIUM:
-            level_classification = 'MEDIUM'
-        elif level_percentage >= LEVEL_THRESHOLD_LOW:
-            level_classification = 'LOW'
-        else:
             level_classification = 'EMPTY'
+            feed_surface_y = FEED_LEVEL_EMPTY_Y  # Report empty position
 
         # Calculate confidence based on how well-defined the feed surface is
         # Check density of rows around detected surface
@@ -635,14 +785,14 @@ def measure_feed_level(image):
         if feed_surface_y >= 0 and feed_surface_y < roi_height:
             window_start = max(0, feed_surface_y - 2)
             window_end = min(roi_height, feed_surface_y + 3)
-            window_pixels = np.sum(feed_mask[window_start:window_end, :] > 0)
+            window_pixels = cv2.countNonZero(feed_mask[window_start:window_end, :])
             window_area = (window_end - window_start) * roi_width
             if window_area > 0:
                 confidence = min(100, (window_pixels / window_area) * 200)  # Scale to 0-100
         confidence = round(confidence, 1)
 
         # Count total feed pixels for debugging
-        feed_pixels = np.sum(feed_mask > 0)
+        feed_pixels = cv2.countNonZero(feed_mask)
         jar_x, jar_y, jar_w, jar_h = jar_roi
         jar_pixels = jar_w * jar_h
 
@@ -653,7 +803,9 @@ def measure_feed_level(image):
             'confidence': confidence,
             'raw_feed_pixels': int(feed_pixels),
             'raw_total_pixels': int(jar_pixels),
-            'feed_surface_y': int(feed_surface_y)  # Y-position within ROI
+            'feed_surface_y': int(feed_surface_y),  # Y-position within ROI
+            'surface_spread': int(surface_spread),
+            'method': 'cv_consensus'
         }
 
     except Exception as e:
@@ -668,6 +820,47 @@ def measure_feed_level(image):
             'feed_surface_y': -1
         }
 
+def cv_reading_is_decisive(feed_data):
+    """
+    Decide whether a classical CV reading is clear enough to skip ML inference.
+
+    Args:
+        feed_data: Result of measure_feed_level
+
+    Returns:
+        bool: True if at least two methods agreed tightly, confidence is high,
+              and the percentage is not close to a level threshold
+    """
+    if not feed_data['jar_detected']:
+        return False
+    spread = feed_data.get('surface_spread', -1)
+    if spread < 0 or spread > ML_GATE_MAX_SPREAD_PX:
+        return False
+    if feed_data['confidence'] < ML_GATE_MIN_CONFIDENCE:
+        return False
+    percentage = feed_data['level_percentage']
+    return all(abs(percentage - threshold) >= ML_GATE_THRESHOLD_MARGIN
+               for threshold in LEVEL_THRESHOLDS.values())
+
+def cached_reading_for(thumb):
+    """
+    Return the last fresh feed_data if this frame's ROI looks unchanged.
+
+    Args:
+        thumb: Downscaled ROI grayscale (FRAME_CACHE_THUMB_SIZE)
+
+    Returns:
+        dict or None: Cached feed_data, or None if the scene changed / cache expired
+    """
+    if last_frame_cache is None:
+        return None
+    last_thumb, feed_data, cached_at = last_frame_cache
+    if time.monotonic() - cached_at >= FRAME_CACHE_MAX_AGE:
+        return None
+    # Tolerant compare - sensor noise means an exact hash would never match
+    mean_diff = cv2.norm(thumb, last_thumb, cv2.NORM_L1) / thumb.size
+    return feed_data if mean_diff <= FRAME_CACHE_MAX_DIFF else None
+
 def publish_last_known_value():
     """
     Republish the last valid feed reading during lights-out hours.
@@ -686,7 +879,7 @@ def publish_last_known_value():
     republished_data['timestamp'] = int(time.time())
     republished_data['state'] = 'lights_off_retained'  # Indicate this is a retained value
 
-    mqtt_client.publish('beeper/feed/level/current', json.dumps(republished_data))
+    mqtt_client.publish(TOPIC_FEED_LEVEL, dumps_json(republished_data), qos=FEED_PUBLISH_QOS)
     print(f"📤 Republished last known value: {republished_data['level']} ({republished_data['percentage']:.1f}%) [LIGHTS OFF]")
 
 def publish_feed_data(feed_data, image_quality):
@@ -697,21 +890,21 @@ def publish_feed_data(feed_data, image_quality):
         feed_data: Dict containing feed level measurements
         image_quality: Tuple of (is_valid, quality_score, blur_score, brightness)
     """
-    global feed_history, last_valid_reading
+    global last_valid_reading
     timestamp = int(time.time())
 
     is_valid, quality_score, blur_score, brightness = image_quality
 
-    # Update feed history
+    # Update feed history (bounded deque drops the oldest reading itself)
     feed_history.append(feed_data['level_percentage'])
-    if len(feed_history) > FEED_HISTORY_SIZE:
-        feed_history.pop(0)
 
     # Calculate trend (increasing, decreasing, stable)
     trend = 'stable'
     if len(feed_history) >= 2:
-        recent_avg = np.mean(feed_history[-2:])
-        older_avg = np.mean(feed_history[:-2]) if len(feed_history) > 2 else feed_history[0]
+        # Plain arithmetic: np.mean on 2-4 floats is mostly array-construction overhead
+        recent_avg = (feed_history[-1] + feed_history[-2]) / 2
+        older = list(feed_history)[:-2]  # deques don't slice
+        older_avg = sum(older) / len(older) if older else feed_history[0]
         diff = recent_avg - older_avg
         if abs(diff) > 5:  # More than 5% change
             trend = 'decreasing' if diff < 0 else 'increasing'
@@ -732,7 +925,7 @@ def publish_feed_data(feed_data, image_quality):
         'sensor_type': 'camera',
         'location': 'raspberry_pi'
     }
-    mqtt_client.publish('beeper/feed/level/current', json.dumps(current_data))
+    mqtt_client.publish(TOPIC_FEED_LEVEL, dumps_json(current_data), qos=FEED_PUBLISH_QOS)
 
     # Store this as the last valid reading (for use during lights-out)
     last_valid_reading = current_data.copy()
@@ -750,7 +943,7 @@ def publish_feed_data(feed_data, image_quality):
         'sensor_type': 'camera',
         'location': 'raspberry_pi'
     }
-    mqtt_client.publish('beeper/feed/level/raw', json.dumps(raw_data))
+    mqtt_client.publish(TOPIC_FEED_RAW, dumps_json(raw_data), qos=FEED_PUBLISH_QOS)
 
     # Publish alerts if needed
     alert_type = None
@@ -784,7 +977,7 @@ def publish_feed_data(feed_data, image_quality):
             'sensor_type': 'camera',
             'location': 'raspberry_pi'
         }
-        mqtt_client.publish('beeper/feed/alerts/status', json.dumps(alert_data))
+        mqtt_client.publish(TOPIC_FEED_ALERTS, dumps_json(alert_data), qos=FEED_PUBLISH_QOS)
 
     # Log to console
     print(f"📤 Feed: {feed_data['level_classification']} ({feed_data['level_percentage']:.1f}%) | "
@@ -794,6 +987,7 @@ def publish_feed_data(feed_data, image_quality):
 
 def monitor_feed():
     """Main monitoring cycle - capture, analyze, and publish feed data."""
+    global cycles_since_ml, last_frame_cache
     try:
         print(f"\n{'='*60}")
         print(f"Feed Monitor Cycle - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -819,74 +1013,96 @@ def monitor_feed():
             print(f"✗ Failed to capture image, skipping cycle")
             return
 
+        # Frames stay in memory; only persist them when debugging
+        if DEBUG_SAVE_FRAMES:
+            cv2.imwrite(DEBUG_FRAME_PATH, image, [cv2.IMWRITE_JPEG_QUALITY, 90])
+
+        # Crop the ROI and convert it to grayscale once for all checks below
+        roi_ctx = build_roi_context(image)
+
         # Validate image quality
-        is_valid, quality_score, blur_score, brightness = validate_image_quality(image)
+        is_valid, quality_score, blur_score, brightness = validate_image_quality(image, roi_ctx)
         print(f"✓ Image quality: {quality_score:.0f} (blur={blur_score:.1f}, brightness={brightness:.1f})")
 
         if not is_valid:
             print(f"⚠️  Image quality below threshold, results may be inaccurate")
 
         # Validate ROI alignment
-        alignment_ok, alignment_msg = validate_roi_alignment(image)
+        alignment_ok, alignment_msg = validate_roi_alignment(image, roi_ctx)
         print(f"✓ ROI alignment: {alignment_msg}")
 
         if not alignment_ok:
             print(f"⚠️  ROI alignment check FAILED - skipping measurement")
             # Publish alert
-            alert_data = {
-                'alert_type': 'roi_alignment_failed',
-                'severity': 'warning',
-                'message': alignment_msg,
-                'timestamp': int(time.time()),
-                'sensor_type': 'camera',
-                'location': 'raspberry_pi'
-            }
-            mqtt_client.publish('beeper/feed/alerts/status', json.dumps(alert_data))
+            alert_payload = ALIGNMENT_ALERT_TEMPLATE % (dumps_json(alignment_msg), int(time.time()))
+            mqtt_client.publish(TOPIC_FEED_ALERTS, alert_payload, qos=FEED_PUBLISH_QOS)
             return  # Skip this cycle
 
-        # Predict feed level using ML model
-        ml_result = predict_feed_level_ml(image)
-
-        if ml_result['success']:
-            # Convert ML prediction to feed_data format for compatibility
-            level_percentage = ml_result['percentage']
-
-            # Classify feed level based on thresholds
-            if level_percentage >= LEVEL_THRESHOLD_FULL:
-                level_classification = 'FULL'
-            elif level_percentage >= LEVEL_THRESHOLD_MEDIUM:
-                level_classification = 'MEDIUM'
-            elif level_percentage >= LEVEL_THRESHOLD_LOW:
-                level_classification = 'LOW'
-            else:
-                level_classification = 'EMPTY'
-
-            feed_data = {
-                'jar_detected': True,
-                'level_percentage': level_percentage,
-                'level_classification': level_classification,
-                'confidence': ml_result['confidence'],
-                'raw_feed_pixels': 0,  # Not applicable for ML
-                'raw_total_pixels': 0,
-                'feed_surface_y': -1,  # Not applicable for ML
-                'method': ml_result['method']
-            }
+        # Static scene (no feeding, no chickens in view): reuse the last reading
+        thumb = cv2.resize(roi_ctx['gray'], FRAME_CACHE_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        cached_data = cached_reading_for(thumb)
+        if cached_data is not None:
+            print(f"✓ ROI unchanged, reusing last reading: {cached_data['level_classification']} "
+                  f"({cached_data['level_percentage']:.1f}%)")
+            publish_feed_data(cached_data, (is_valid, quality_score, blur_score, brightness))
+            return
 
-            print(f"✓ ML Prediction: {level_classification} ({level_percentage:.1f}%) "
-                  f"[confidence: {ml_result['confidence']:.0f}%]")
+        # Classical CV first; skip ML while it is decisive (forced periodically)
+        cv_data = None
+        if ML_GATE_ENABLED and cycles_since_ml + 1 < ML_FORCE_EVERY_N_CYCLES:
+            cv_data = measure_feed_level(image, roi_ctx)
+            if not cv_reading_is_decisive(cv_data):
+                cv_data = None
+
+        if cv_data is not None:
+            cycles_since_ml += 1
+            feed_data = cv_data
+            print(f"✓ CV reading decisive, ML skipped: {feed_data['level_classification']} "
+                  f"({feed_data['level_percentage']:.1f}%) [confidence: {feed_data['confidence']:.0f}%]")
         else:
-            # ML prediction failed
-            print(f"✗ ML prediction failed: {ml_result['error']}")
-            feed_data = {
-                'jar_detected': False,
-                'level_percentage': 0,
-                'level_classification': 'ERROR',
-                'confidence': 0,
-                'raw_feed_pixels': 0,
-                'raw_total_pixels': 0,
-                'feed_surface_y': -1,
-                'method': 'ml_tflite_error'
-            }
+            # Predict feed level using ML model
+            cycles_since_ml = 0
+            ml_result = predict_feed_level_ml(image, roi_ctx)
+
+            if ml_result['success']:
+                # Convert ML prediction to feed_data format for compatibility
+                level_percentage = ml_result['percentage']
+
+                # Classify feed level based on thresholds (highest first)
+                level_classification = next(
+                    (name for name, threshold in LEVEL_THRESHOLDS.items() if level_percentage >= threshold),
+                    LEVEL_NAMES[0])
+
+                feed_data = {
+                    'jar_detected': True,
+                    'level_percentage': level_percentage,
+                    'level_classification': level_classification,
+                    'confidence': ml_result['confidence'],
+                    'raw_feed_pixels': 0,  # Not applicable for ML
+                    'raw_total_pixels': 0,
+                    'feed_surface_y': -1,  # Not applicable for ML
+                    'method': ml_result['method']
+                }
+
+                print(f"✓ ML Prediction: {level_classification} ({level_percentage:.1f}%) "
+                      f"[confidence: {ml_result['confidence']:.0f}%]")
+            else:
+                # ML prediction failed
+                print(f"✗ ML prediction failed: {ml_result['error']}")
+                feed_data = {
+                    'jar_detected': False,
+                    'level_percentage': 0,
+                    'level_classification': 'ERROR',
+                    'confidence': 0,
+                    'raw_feed_pixels': 0,
+                    'raw_total_pixels': 0,
+                    'feed_surface_y': -1,
+                    'method': 'ml_tflite_error'
+                }
+
+        # Remember this frame so an unchanged scene can skip the next measurement
+        if feed_data['jar_detected']:
+            last_frame_cache = (thumb, feed_data, time.monotonic())
 
         # Publish to MQTT (and store as last valid reading)
         publish_feed_data(feed_data, (is_valid, quality_score, blur_score, brightness))
@@ -925,10 +1141,20 @@ def main():
     print("Press Ctrl+C to stop\n")
 
     try:
+        # Fixed-rate schedule: capture/inference time is subtracted from the
+        # sleep; if a cycle overruns, start the next one immediately
+        deadline = time.monotonic()
         while True:
             monitor_feed()
-            print(f"\n💤 Sleeping for {CAPTURE_INTERVAL_SECONDS} seconds...\n")
-            time.sleep(CAPTURE_INTERVAL_SECONDS)
+            # stdout is block-buffered under systemd: one write per cycle, not per line
+            sys.stdout.flush()
+            deadline += CAPTURE_INTERVAL_SECONDS
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                print(f"\n💤 Sleeping for {sleep_for:.0f} seconds...\n")
+                time.sleep(sleep_for)
+            else:
+                deadline = time.monotonic()
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down feed monitor...")
         mqtt_client.loop_stop()
@@ -1,11 +1,28 @@
 #!/usr/bin/env python3
 """
 Reads camera metadata stream and writes only the latest value to /tmp/camera_metadata.json
-Updates every 1 second
+Updates at most once per second, and only when the stream has been written
+(inotify via inotify_simple; falls back to polling every second without it)
 """
+import os
 import time
-import json
-import re
+
+# Optional fast JSON (orjson); falls back to stdlib json
+try:
+    from orjson import loads as loads_json, dumps as dumps_json
+except ImportError:
+    import json
+
+    def loads_json(data):
+        return json.loads(data)
+
+    def dumps_json(obj):
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 STREAM_FILE = '/tmp/camera_metadata_stream.txt'
 OUTPUT_FILE = '/var/tmp/camera_metadata.json'
@@ -14,46 +31,88 @@ print("📷 Camera metadata updater started")
 print(f"Reading from: {STREAM_FILE}")
 print(f"Writing to: {OUTPUT_FILE}")
 
+INOTIFY_TIMEOUT_MS = 5000  # Re-check that the watched file is still the stream file
+TAIL_BYTES = 10240         # Newest bytes kept for finding the latest record
+
+# Stream file kept open between ticks; only bytes appended since `offset` are read
+stream_fd = None
+stream_ino = None
+offset = 0
+tail = bytearray()
+
+inotify = INotify() if INotify is not None else None
+watch = None
+watch_ino = None
+print(f"Change detection: {'inotify' if inotify is not None else 'polling (pip3 install inotify_simple)'}")
+
 while True:
     try:
-        # Efficiently read only the last 10KB from the stream file
-        with open(STREAM_FILE, 'rb') as f:
-            f.seek(0, 2)  # Seek to end
-            file_size = f.tell()
-            read_size = min(10240, file_size)  # Read last 10KB max
-            f.seek(max(0, file_size - read_size))
-            content = f.read().decode('utf-8', errors='ignore')
-
-        # Find all JSON objects using regex (handles multi-line pretty-print)
-        # Look for pattern: },\n{ or just trailing }
-        objects = re.split(r'\},\s*\n\s*\{', content)
-
-        if objects:
-            # Get the last object
-            last_obj = objects[-1]
-
-            # Fix if it's missing opening/closing braces
-            if not last_obj.strip().startswith('{'):
-                last_obj = '{' + last_obj
-            if not last_obj.strip().endswith('}'):
-                last_obj = last_obj + '}'
-
-            try:
-                # Parse and write the latest metadata
-                metadata = json.loads(last_obj)
-                with open(OUTPUT_FILE, 'w') as out:
-                    json.dump(metadata, out)
-            except json.JSONDecodeError as e:
-                # If parsing fails, try to get the second-to-last which should be complete
-                if len(objects) > 1:
+        ino = os.stat(STREAM_FILE).st_ino
+
+        if inotify is not None:
+            # (Re)attach the watch when the stream file is new or was replaced
+            if watch is None or ino != watch_ino:
+                if watch is not None:
                     try:
-                        prev_obj = '{' + objects[-2] + '}'
-                        metadata = json.loads(prev_obj)
-                        with open(OUTPUT_FILE, 'w') as out:
-                            json.dump(metadata, out)
-                    except:
-                        pass
+                        inotify.rm_watch(watch)
+                    except OSError:
+                        pass  # Old inode already gone
+                watch = inotify.add_watch(STREAM_FILE, inotify_flags.MODIFY)
+                watch_ino = ino
+            else:
+                # Sleep until the camera appends; no wake-ups while the stream is idle
+                if not inotify.read(timeout=INOTIFY_TIMEOUT_MS):
+                    continue
+
+        # Reopen when the stream file is new or was replaced (log rotation)
+        if stream_fd is None or ino != stream_ino:
+            if stream_fd is not None:
+                os.close(stream_fd)
+            stream_fd = os.open(STREAM_FILE, os.O_RDONLY)
+            stream_ino = ino
+            offset = 0
+            tail.clear()
+
+        file_size = os.fstat(stream_fd).st_size
+        if file_size < offset:
+            # Truncated in place - start over from the beginning
+            offset = 0
+            tail.clear()
+
+        if file_size > offset:
+            # Read only what was appended (capped at TAIL_BYTES after a long gap)
+            read_from = max(offset, file_size - TAIL_BYTES)
+            if read_from > offset:
+                tail.clear()
+            tail += os.pread(stream_fd, file_size - read_from, read_from)
+            del tail[:-TAIL_BYTES]
+            offset = file_size
+            content = tail
+
+            # Records are flat JSON objects, so the last '{' before the last '}'
+            # starts the newest one - a backward scan, no regex split of the buffer
+            end = content.rfind(b'}')
+            if end != -1:
+                start = content.rfind(b'{', 0, end)
+                try:
+                    metadata = loads_json(content[start:end + 1])
+                except ValueError:
+                    # Newest record still being written - fall back to the one before
+                    metadata = None
+                    end = content.rfind(b'}', 0, start)
+                    if start > 0 and end != -1:
+                        start = content.rfind(b'{', 0, end)
+                        try:
+                            metadata = loads_json(content[start:end + 1])
+                        except ValueError:
+                            pass
+
+                if metadata is not None:
+                    with open(OUTPUT_FILE, 'wb') as out:
+                        out.write(dumps_json(metadata))
 
+        # At most one parse per second; writes during the sleep queue up as
+        # events and are drained by the next read
         time.sleep(1)
 
     except FileNotFoundError:
@@ -14,10 +14,9 @@ Publishes:
 
 MQTT Topics:
 - beeper/sensors/bme680/all (includes IAQ and CO2 equivalent)
+- beeper/sensors/bme680/bsec_all (full BSEC output: static IAQ, breath VOC, accuracy)
 - beeper/sensors/cpu/temperature
-- beeper/system/cpu_percent
-- beeper/system/memory_percent
-- beeper/system/disk_percent
+- beeper/system/stats (cpu_percent, memory_percent, disk_percent)
 - beeper/camera/csi/metadata
 - beeper/audio/level (basic dB reading)
 - beeper/audio/frequency/all (FFT analysis: peak frequency, spectral centroid, band energies)
@@ -29,6 +28,8 @@ Dependencies:
 - psutil
 - adafruit-circuitpython-bme680 (optional, for BME680 sensor)
 - sounddevice, numpy (optional, for audio monitoring)
+- pysimdjson (optional, faster camera metadata parsing)
+- orjson (optional, faster JSON encoding of MQTT payloads)
 
 Install: pip3 install paho-mqtt psutil adafruit-circuitpython-bme680 sounddevice numpy
 
@@ -41,6 +42,8 @@ License: MIT
 """
 
 import paho.mqtt.client as mqtt
+import bisect
+import sys
 import time
 import json
 import psutil
@@ -50,6 +53,7 @@ import math
 import numpy as np
 import pytz
 import threading
+from collections import deque
 
 # Audio sample rate constant (shared by capture and FFT analysis)
 AUDIO_SAMPLE_RATE = 48000  # USB webcam microphone sample rate
@@ -72,9 +76,35 @@ bme680 = None
 audio_stream = None
 audio_enabled = False
 
+# FFT frequency bands: AUDIO_BAND_NAMES[i] covers [AUDIO_BAND_EDGES[i], AUDIO_BAND_EDGES[i+1]) Hz
+AUDIO_BAND_NAMES = (
+    'low',        # 0-500: Rumbling, mechanical noise
+    'mid_low',    # 500-2000: General coop noise
+    'mid_high',   # 2000-4000: Chick chirps, normal vocalizations
+    'high',       # 4000-8000: Alarm calls, distress chirps
+    'very_high',  # 8000-24000: Ultrasonic, equipment noise
+)
+AUDIO_BAND_EDGES = np.array([0, 500, 2000, 4000, 8000, 24000], dtype=np.float64)
+
+# (num_samples, sample_rate) -> (rfft bin frequencies, band boundary indices).
+# Capture length and rate are fixed, so this holds one entry in practice
+fft_axis_cache = {}
+
+# Continuous audio capture: one long-running arecord whose output a reader
+# thread drains into a ring of the most recent second, instead of spawning
+# arecord (fork/exec + ALSA/dsnoop open) for every reading
+AUDIO_WINDOW_BYTES = AUDIO_SAMPLE_RATE * 2     # 1 second of S16_LE mono
+AUDIO_CHUNK_BYTES = AUDIO_WINDOW_BYTES // 10   # 100 ms per pipe read
+AUDIO_STALE_SECONDS = 2                        # Window older than this is not used
+AUDIO_RESTART_DELAY = 5                        # Wait before restarting a dead arecord
+audio_proc = None
+audio_chunks = deque(maxlen=AUDIO_WINDOW_BYTES // AUDIO_CHUNK_BYTES)
+audio_chunks_time = 0.0  # time.monotonic() of the newest chunk
+audio_chunks_lock = threading.Lock()
+
 # Audio monitoring history (for rolling averages and event detection)
-audio_history = []  # List of recent dB readings for rolling averages
 AUDIO_HISTORY_SIZE = 6  # Keep last 60 seconds (6 readings at 10s intervals)
+audio_history = deque(maxlen=AUDIO_HISTORY_SIZE)  # Recent dB readings; oldest drops off
 
 # ML Feed Level globals (async execution to prevent blocking)
 ml_feed_data = None  # Cached ML prediction result
@@ -83,6 +113,12 @@ ml_feed_thread = None  # Background thread handle
 ml_last_update = 0  # Timestamp of last ML update
 ML_UPDATE_INTERVAL = 300  # Run ML prediction every 5 minutes (300s) - TFLite loading is slow on Pi3
 
+# Adafruit driver re-triggers a forced measurement (incl. ~150ms gas heater)
+# on every property access once 1/refresh_rate has elapsed. 1 Hz lets the
+# temperature/humidity/pressure/gas reads in one publish cycle share a
+# single burst register read while still taking a fresh one every cycle.
+BME680_REFRESH_RATE = 1
+
 # BSEC state and calibration directories
 BME680_BASELINE_DIR = '/var/lib/beeperKeeper'
 
@@ -110,6 +146,57 @@ WEATHER_UPDATE_INTERVAL = 1800  # Update weather every 30 minutes
 NWS_FORECAST_URL = "https://api.weather.gov/gridpoints/GYX/11,13/forecast"
 NWS_USER_AGENT = "BeeperKeeper/2.0 (chicken coop monitor)"
 
+# CPU temperature (sysfs regenerates the value on each pread at offset 0,
+# so the file stays open instead of being reopened every cycle)
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+thermal_fd = None
+
+# Disk usage changes slowly; statvfs it at most this often (one in 6 cycles)
+DISK_POLL_INTERVAL = 60  # seconds
+disk_usage_cache = (float('-inf'), 0.0)  # (checked_at monotonic, percent)
+
+# Coop lights schedule (Eastern Time), resolved once instead of every cycle
+ET = pytz.timezone("America/New_York")
+LIGHTS_ON_TIME = dtime(6, 30)   # 6:30 AM
+LIGHTS_OFF_TIME = dtime(19, 0)  # 7:00 PM
+
+# Camera metadata stream (appended by the camera pipeline, one JSON object per frame)
+CAMERA_METADATA_FILE = '/tmp/camera_metadata_stream.txt'
+CAMERA_METADATA_TAIL_BYTES = 5000
+camera_metadata_cache = None  # Last successfully parsed record
+camera_metadata_fd = None  # Kept open across cycles
+camera_metadata_ino = None  # Inode behind camera_metadata_fd (detects recreation)
+camera_metadata_size = -1  # File size when last parsed
+
+# Optional fast JSON encoder/decoder (orjson); falls back to stdlib json
+try:
+    import orjson
+
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes (numpy scalars included)."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(obj):
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    loads_json = json.loads
+
+# Optional SIMD JSON parser (pysimdjson); falls back to loads_json
+try:
+    import simdjson
+    _json_parser = simdjson.Parser()
+
+    def parse_json_bytes(data):
+        """Parse a JSON object from bytes into a dict."""
+        return _json_parser.parse(data).as_dict()
+except ImportError:
+    def parse_json_bytes(data):
+        """Parse a JSON object from bytes into a dict."""
+        return loads_json(data)
+
 
 def fetch_weather():
     """Fetch weather data from National Weather Service API."""
@@ -132,7 +219,7 @@ def fetch_weather():
         )
 
         with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
+            data = loads_json(response.read())
 
         periods = data.get('properties', {}).get('periods', [])
 
@@ -190,14 +277,14 @@ def publish_weather():
 
     if weather['current']:
         # Publish current conditions
-        mqtt_client.publish("beeper/weather/current", json.dumps(weather['current']))
+        mqtt_client.publish("beeper/weather/current", dumps_json(weather['current']))
 
         # Publish forecast
         if weather['forecast']:
-            mqtt_client.publish("beeper/weather/forecast", json.dumps(weather['forecast']))
+            mqtt_client.publish("beeper/weather/forecast", dumps_json(weather['forecast']))
 
         # Publish combined for easy frontend consumption
-        mqtt_client.publish("beeper/weather/all", json.dumps({
+        mqtt_client.publish("beeper/weather/all", dumps_json({
             'current': weather['current'],
             'forecast': weather['forecast'],
             'timestamp': int(time.time())
@@ -269,14 +356,16 @@ def init_bme680():
         i2c = busio.I2C(board.SCL, board.SDA)
 
         try:
-            bme680 = adafruit_bme680.Adafruit_BME680_I2C(i2c, address=BME680_I2C_ADDRESS)
+            bme680 = adafruit_bme680.Adafruit_BME680_I2C(i2c, address=BME680_I2C_ADDRESS,
+                                                          refresh_rate=BME680_REFRESH_RATE)
             print(f"✓ BME680 sensor detected at 0x{BME680_I2C_ADDRESS:02x}")
             print("  Using BSEC for IAQ/CO2 calculations (vendor algorithm)")
             return True
         except:
             # Try alternate address
             alt_address = 0x77 if BME680_I2C_ADDRESS == 0x76 else 0x76
-            bme680 = adafruit_bme680.Adafruit_BME680_I2C(i2c, address=alt_address)
+            bme680 = adafruit_bme680.Adafruit_BME680_I2C(i2c, address=alt_address,
+                                                          refresh_rate=BME680_REFRESH_RATE)
             print(f"✓ BME680 sensor detected at 0x{alt_address:02x}")
             return True
     except Exception as e:
@@ -291,21 +380,21 @@ def save_bsec_calibration_start():
     global BSEC_CAL_START_FILE
 
     # Check if file already exists - don't overwrite existing calibration timestamp
-    if os.path.exists(BSEC_CAL_START_FILE):
-        try:
-            with open(BSEC_CAL_START_FILE, 'r') as f:
-                timestamp = float(f.read().strip())
-                elapsed_hours = (time.time() - timestamp) / 3600.0
-                print(f"✓ BSEC calibration in progress: {elapsed_hours:.1f} hours elapsed")
-                return True
-        except:
-            pass  # File exists but corrupted, will recreate
+    try:
+        with open(BSEC_CAL_START_FILE, 'r') as f:
+            timestamp = float(f.read().strip())
+            elapsed_hours = (time.time() - timestamp) / 3600.0
+            print(f"✓ BSEC calibration in progress: {elapsed_hours:.1f} hours elapsed")
+            return True
+    except FileNotFoundError:
+        pass  # No calibration started yet, create it below
+    except (OSError, ValueError):
+        pass  # File exists but unreadable/corrupted, will recreate
 
     # File doesn't exist, create it with current timestamp
     try:
-        # Try to create directory if it doesn't exist
-        if not os.path.exists(BME680_BASELINE_DIR):
-            os.makedirs(BME680_BASELINE_DIR, mode=0o755, exist_ok=True)
+        # Create directory if it doesn't exist
+        os.makedirs(BME680_BASELINE_DIR, mode=0o755, exist_ok=True)
 
         with open(BSEC_CAL_START_FILE, 'w') as f:
             f.write(str(int(time.time())))
@@ -330,20 +419,23 @@ def load_bsec_calibration_start():
     """
     Load BSEC calibration start timestamp from file.
     Returns timestamp (float) or None if not found.
+
+    Called every publish cycle: opens directly (a missing file is just
+    FileNotFoundError) rather than checking os.path.exists first.
     """
     global BSEC_CAL_START_FILE
 
     try:
-        if os.path.exists(BSEC_CAL_START_FILE):
-            with open(BSEC_CAL_START_FILE, 'r') as f:
-                return float(f.read().strip())
+        with open(BSEC_CAL_START_FILE, 'r') as f:
+            return float(f.read().strip())
+    except FileNotFoundError:
+        pass
     except PermissionError:
         # Try fallback location
         BSEC_CAL_START_FILE = BSEC_CAL_START_FALLBACK
         try:
-            if os.path.exists(BSEC_CAL_START_FILE):
-                with open(BSEC_CAL_START_FILE, 'r') as f:
-                    return float(f.read().strip())
+            with open(BSEC_CAL_START_FILE, 'r') as f:
+                return float(f.read().strip())
         except:
             pass
     except:
@@ -351,6 +443,10 @@ def load_bsec_calibration_start():
 
     return None
 
+# classify_iaq bands: value <= IAQ_UPPER_BOUNDS[i] -> IAQ_LABELS[i]; above all -> last label
+IAQ_UPPER_BOUNDS = (50, 100, 150, 200, 300)
+IAQ_LABELS = ('Excellent', 'Good', 'Moderate', 'Poor', 'Very Poor', 'Severe')
+
 def classify_iaq(iaq_value):
     """
     Classify IAQ value according to BSEC standard thresholds.
@@ -367,18 +463,8 @@ def classify_iaq(iaq_value):
     if iaq_value is None:
         return None
 
-    if iaq_value <= 50:
-        return 'Excellent'
-    elif iaq_value <= 100:
-        return 'Good'
-    elif iaq_value <= 150:
-        return 'Moderate'
-    elif iaq_value <= 200:
-        return 'Poor'
-    elif iaq_value <= 300:
-        return 'Very Poor'
-    else:
-        return 'Severe'
+    # Upper bounds are inclusive, so bisect_left lands on the first bound >= value
+    return IAQ_LABELS[bisect.bisect_left(IAQ_UPPER_BOUNDS, iaq_value)]
 
 # BSEC 2.6.1.0 Integration
 # Must be initialized after function definitions but before main()
@@ -408,52 +494,85 @@ def init_audio():
         # Enable audio without testing - we'll handle errors during actual capture
         # The USB webcam audio is already being streamed by ffmpeg to rtsp://localhost:8554/usb_camera
         audio_enabled = True
+        threading.Thread(target=audio_capture_loop, daemon=True).start()
         print(f"✓ Audio monitoring enabled on USB webcam RTSP stream")
         return True
     except Exception as e:
         print(f"ℹ Audio initialization failed: {e}. Audio monitoring disabled.")
         return False
 
+def audio_capture_loop():
+    """
+    Background thread: run arecord continuously and keep the latest second of audio.
+
+    Reads 100 ms chunks from arecord's stdout into audio_chunks (oldest dropped),
+    so the pipe never backs up and get_audio_level always sees current audio.
+    Restarts arecord after AUDIO_RESTART_DELAY if it exits.
+    """
+    global audio_proc, audio_chunks_time
+    import subprocess
+
+    # Capture from dsnoop_usb device (configured in ~/.asoundrc)
+    # dsnoop allows multiple programs (ffmpeg + mqtt_publisher) to share USB webcam mic
+    # Use the global constant for sample rate consistency
+    cmd = [
+        'arecord', '-D', 'dsnoop_usb', '-q', '-f', 'S16_LE',
+        '-r', str(AUDIO_SAMPLE_RATE), '-c', '1', '-t', 'raw'
+    ]
+
+    while True:
+        proc = None
+        try:
+            proc = audio_proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            while True:
+                chunk = proc.stdout.read(AUDIO_CHUNK_BYTES)
+                if len(chunk) < AUDIO_CHUNK_BYTES:
+                    break  # EOF - arecord exited
+                with audio_chunks_lock:
+                    audio_chunks.append(chunk)
+                    audio_chunks_time = time.monotonic()
+            print(f"✗ arecord exited (code {proc.wait()}), restarting in {AUDIO_RESTART_DELAY}s")
+        except Exception as e:
+            print(f"✗ Audio capture error: {e}")
+        finally:
+            # Never leave this run's arecord holding dsnoop when the next one starts
+            if proc is not None:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.wait()
+                proc.stdout.close()
+        with audio_chunks_lock:
+            audio_chunks.clear()
+        time.sleep(AUDIO_RESTART_DELAY)
+
 def get_audio_level():
     """
     Measure current audio level in decibels (dB) using ALSA dsnoop for shared capture.
     Returns: tuple of (dB level, audio_data array) or (None, None) if audio disabled
+             or no current second of audio is buffered yet
 
     Note: Uses AUDIO_SAMPLE_RATE constant (48kHz) matching the dsnoop configuration in ~/.asoundrc
+    Note: Audio comes from the last second buffered by audio_capture_loop (no blocking capture)
     """
     if not audio_enabled:
         return None, None
 
     try:
-        import subprocess
-        import struct
-
-        # Capture 1 second of audio from dsnoop_usb device (configured in ~/.asoundrc)
-        # dsnoop allows multiple programs (ffmpeg + mqtt_publisher) to share USB webcam mic
-        duration = 1
-        # Use the global constant for sample rate consistency
-        sample_rate = AUDIO_SAMPLE_RATE
-
-        cmd = [
-            'arecord', '-D', 'dsnoop_usb', '-d', str(duration), '-f', 'S16_LE',
-            '-r', str(sample_rate), '-c', '1', '-t', 'raw'
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, timeout=3)
-
-        if result.returncode != 0 or len(result.stdout) == 0:
-            return None, None
-
-        # Parse raw audio data (16-bit signed integers)
-        audio_bytes = result.stdout
-        num_samples = len(audio_bytes) // 2
-        audio_data = np.array(struct.unpack(f'{num_samples}h', audio_bytes), dtype=np.float32)
-
-        # Normalize to -1.0 to 1.0 range
-        audio_data = audio_data / 32768.0
-
-        # Calculate RMS (Root Mean Square) amplitude
-        rms = np.sqrt(np.mean(audio_data**2))
+        # Latest 1 second from the capture thread (must be full and current)
+        with audio_chunks_lock:
+            if (len(audio_chunks) < audio_chunks.maxlen
+                    or time.monotonic() - audio_chunks_time > AUDIO_STALE_SECONDS):
+                return None, None
+            audio_bytes = b''.join(audio_chunks)
+
+        # Parse raw audio data (16-bit signed little-endian) without copying the
+        # bytes, then convert and normalize to -1.0 to 1.0 in one float32 pass
+        audio_i16 = np.frombuffer(audio_bytes, dtype='<i2', count=len(audio_bytes) // 2)
+        audio_data = audio_i16.astype(np.float32)
+        audio_data *= np.float32(1.0 / 32768.0)
+
+        # Calculate RMS (Root Mean Square) amplitude (dot product: one pass, no x**2 temporary)
+        rms = np.sqrt(np.dot(audio_data, audio_data) / audio_data.size)
 
         # Convert to decibels (dB SPL - Sound Pressure Level)
         # Reference: 20 micropascals (threshold of human hearing)
@@ -477,9 +596,6 @@ def get_audio_level():
             return float(round(db_normalized, 1)), audio_data  # Return both dB and raw audio data
         else:
             return 0.0, audio_data
-    except subprocess.TimeoutExpired:
-        print(f"✗ Audio capture timed out")
-        return None, None
     except Exception as e:
         print(f"✗ Audio level read error: {e}")
         return None, None
@@ -501,30 +617,32 @@ def analyze_audio_frequency(audio_data, sample_rate=None):
     try:
         # Perform FFT (Fast Fourier Transform)
         fft_data = np.fft.rfft(audio_data)
-        fft_magnitude = np.abs(fft_data)
-        fft_freqs = np.fft.rfftfreq(len(audio_data), 1.0/sample_rate)
-
-        # Define frequency bands (Hz)
-        bands = {
-            'low': (0, 500),           # Rumbling, mechanical noise
-            'mid_low': (500, 2000),    # General coop noise
-            'mid_high': (2000, 4000),  # Chick chirps, normal vocalizations
-            'high': (4000, 8000),      # Alarm calls, distress chirps
-            'very_high': (8000, 24000) # Ultrasonic, equipment noise
-        }
-
-        # Calculate energy in each band
-        band_energies = {}
-        total_energy = np.sum(fft_magnitude ** 2)
 
-        for band_name, (low_freq, high_freq) in bands.items():
-            # Find indices for this frequency range
-            band_indices = np.where((fft_freqs >= low_freq) & (fft_freqs < high_freq))[0]
-            if len(band_indices) > 0:
-                band_energy = np.sum(fft_magnitude[band_indices] ** 2)
-                band_energies[band_name] = float(band_energy)
-            else:
-                band_energies[band_name] = 0.0
+        # Bin frequencies and band boundaries depend only on length and rate
+        axis_key = (len(audio_data), sample_rate)
+        fft_axis = fft_axis_cache.get(axis_key)
+        if fft_axis is None:
+            fft_freqs = np.fft.rfftfreq(len(audio_data), 1.0/sample_rate)
+            fft_freqs.flags.writeable = False
+            fft_axis = (fft_freqs, np.searchsorted(fft_freqs, AUDIO_BAND_EDGES).tolist())
+            fft_axis_cache[axis_key] = fft_axis
+        fft_freqs, band_bounds = fft_axis
+
+        # Power spectrum (|X|^2) computed once and shared by every metric below -
+        # re^2 + im^2 skips the sqrt of np.abs and the re-squaring per band
+        fft_power = fft_data.real * fft_data.real
+        fft_power += fft_data.imag * fft_data.imag
+
+        # Calculate energy in each band. rFFT bins are sorted by frequency, so each
+        # band is a contiguous slice between the cached band_bounds and the bands
+        # are summed in one sweep over fft_power (no masks or gathers).
+        # Plain slices rather than np.add.reduceat, which returns a bin instead of 0
+        # for an empty band.
+        total_energy = fft_power.sum()
+        band_energies = {
+            band_name: float(fft_power[band_bounds[i]:band_bounds[i + 1]].sum())
+            for i, band_name in enumerate(AUDIO_BAND_NAMES)
+        }
 
         # Calculate percentage of total energy per band
         band_percentages = {}
@@ -535,13 +653,13 @@ def analyze_audio_frequency(audio_data, sample_rate=None):
             for band_name in band_energies:
                 band_percentages[band_name] = 0.0
 
-        # Find peak frequency (dominant frequency)
-        peak_idx = np.argmax(fft_magnitude)
+        # Find peak frequency (dominant frequency; same bin as the magnitude peak)
+        peak_idx = np.argmax(fft_power)
         peak_frequency = float(fft_freqs[peak_idx])
 
         # Calculate spectral centroid (weighted mean of frequencies - indicates "brightness")
         if total_energy > 0:
-            spectral_centroid = float(np.sum(fft_freqs * (fft_magnitude ** 2)) / total_energy)
+            spectral_centroid = float(np.dot(fft_freqs, fft_power) / total_energy)
         else:
             spectral_centroid = 0.0
 
@@ -576,7 +694,8 @@ def get_audio_statistics():
         return None
 
     try:
-        recent_values = audio_history[-6:]  # Last 60 seconds
+        # Last 60 seconds as one array (the deque holds at most AUDIO_HISTORY_SIZE)
+        recent_values = np.fromiter(audio_history, dtype=np.float64, count=len(audio_history))
 
         # Rolling averages
         avg_30s = float(np.mean(recent_values[-3:])) if len(recent_values) >= 3 else None
@@ -641,17 +760,19 @@ def detect_audio_event(current_db, stats):
         return "quiet"
 
 
-def get_current_lights_state():
-    """Determine if lights should be on or off based on Eastern Time schedule."""
+def get_current_lights_state(now=None):
+    """
+    Determine if lights should be on or off based on Eastern Time schedule.
+
+    Args:
+        now: Optional current Eastern Time datetime (defaults to datetime.now(ET))
+    """
     try:
-        est = pytz.timezone("America/New_York")
-        now = datetime.now(est)
+        if now is None:
+            now = datetime.now(ET)
         current_time = now.time()
         
-        lights_on_time = dtime(6, 30)   # 6:30 AM
-        lights_off_time = dtime(19, 0)  # 7:00 PM
-        
-        if lights_on_time <= current_time < lights_off_time:
+        if LIGHTS_ON_TIME <= current_time < LIGHTS_OFF_TIME:
             return "on"
         else:
             return "off"
@@ -662,13 +783,12 @@ def get_current_lights_state():
 def publish_lights_state():
     """Publish current lights state to MQTT every cycle for continuous chart data."""
     try:
-        current_state = get_current_lights_state()
+        now = datetime.now(ET)
+        current_state = get_current_lights_state(now)
         
         if current_state is None:
             return
         
-        est = pytz.timezone("America/New_York")
-        now = datetime.now(est)
         timestamp = int(time.time())
         
         lights_data = {
@@ -679,7 +799,7 @@ def publish_lights_state():
             "location": "raspberry_pi"
         }
         
-        mqtt_client.publish("beeper/lights/state", json.dumps(lights_data))
+        mqtt_client.publish("beeper/lights/state", dumps_json(lights_data))
         print(f"📤 Lights: {current_state.upper()}")
         
     except Exception as e:
@@ -688,7 +808,7 @@ def publish_lights_state():
 def update_bsec_cache():
     """
     Read BSEC data and update cache for use by main publish_sensor_data().
-    Also publishes detailed BSEC topics for advanced monitoring.
+    Also publishes the full BSEC output on beeper/sensors/bme680/bsec_all.
     """
     global bsec_available, bsec_cache
 
@@ -720,28 +840,12 @@ def update_bsec_cache():
         else:
             bsec_cache['calibration_progress'] = 0
 
-        # Publish detailed BSEC metrics (separate topics for advanced monitoring)
-        if data.get('iaq') is not None:
-            mqtt_client.publish("beeper/sensors/bme680/iaq_bsec",
-                              json.dumps({"value": data['iaq'], "accuracy": data['iaq_accuracy'], "timestamp": timestamp}))
-
-        if data.get('static_iaq') is not None:
-            mqtt_client.publish("beeper/sensors/bme680/static_iaq_bsec",
-                              json.dumps({"value": data['static_iaq'], "timestamp": timestamp}))
-
-        if data.get('co2_equivalent') is not None:
-            mqtt_client.publish("beeper/sensors/bme680/co2_bsec",
-                              json.dumps({"value": data['co2_equivalent'], "timestamp": timestamp}))
-
-        if data.get('breath_voc_equivalent') is not None:
-            mqtt_client.publish("beeper/sensors/bme680/breath_voc_bsec",
-                              json.dumps({"value": data['breath_voc_equivalent'], "timestamp": timestamp}))
-
-        # Publish combined BSEC data (detailed topic)
+        # Publish combined BSEC data (detailed topic - carries every BSEC field, so
+        # the per-metric iaq/static_iaq/co2/breath_voc duplicates are not sent)
         data['timestamp'] = timestamp
         data['sensor_type'] = 'bme680_bsec'
         data['location'] = 'raspberry_pi'
-        mqtt_client.publish("beeper/sensors/bme680/bsec_all", json.dumps(data))
+        mqtt_client.publish("beeper/sensors/bme680/bsec_all", dumps_json(data))
 
         # Log BSEC calibration status
         accuracy_stars = "★" * data['iaq_accuracy'] + "☆" * (3 - data['iaq_accuracy'])
@@ -753,14 +857,61 @@ def update_bsec_cache():
 
 def get_cpu_temp():
     """Read CPU temperature from thermal zone."""
+    global thermal_fd
     try:
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            return round(float(f.read().strip()) / 1000.0, 1)
+        if thermal_fd is None:
+            thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        raw = int(os.pread(thermal_fd, 16, 0))  # millidegrees C
+        return ((raw + 50) // 100) / 10
     except:
         return None
 
+def read_camera_metadata():
+    """
+    Return the most recent camera metadata record from the stream file.
+
+    Works on the raw tail bytes (no UTF-8 decode). If the newest record is
+    partial or unparseable, the previously cached record is returned.
+    The file descriptor stays open between calls and the tail is only
+    re-read when the file has grown since the last parse.
+    """
+    global camera_metadata_cache, camera_metadata_fd, camera_metadata_ino, camera_metadata_size
+    try:
+        # Reopen if the stream was recreated (new inode) or never opened
+        ino = os.stat(CAMERA_METADATA_FILE).st_ino
+        if camera_metadata_fd is None or ino != camera_metadata_ino:
+            if camera_metadata_fd is not None:
+                os.close(camera_metadata_fd)
+            camera_metadata_fd = os.open(CAMERA_METADATA_FILE, os.O_RDONLY)
+            camera_metadata_ino = ino
+            camera_metadata_size = -1
+
+        file_size = os.fstat(camera_metadata_fd).st_size
+        if file_size == camera_metadata_size:
+            return camera_metadata_cache  # Nothing appended since last cycle
+
+        offset = max(0, file_size - CAMERA_METADATA_TAIL_BYTES)
+        tail_data = os.pread(camera_metadata_fd, file_size - offset, offset)
+        camera_metadata_size = file_size
+    except OSError:
+        return None  # Camera metadata is optional
+
+    # rpicam-vid records are flat objects, so the last '{' before the last '}'
+    # starts the newest record; bounded rfind scans only that span, backwards
+    last_brace = tail_data.rfind(b'}')
+    if last_brace != -1:
+        first_brace = tail_data.rfind(b'{', max(0, last_brace - 2000), last_brace)
+        if first_brace != -1:
+            try:
+                camera_metadata_cache = parse_json_bytes(tail_data[first_brace:last_brace+1])
+            except (ValueError, RuntimeError):
+                pass  # Partial record, keep previous value
+
+    return camera_metadata_cache
+
 def publish_sensor_data():
     """Read and publish all sensor data to MQTT."""
+    global disk_usage_cache
     timestamp = int(time.time())
 
     # First update BSEC cache (reads BSEC and publishes detailed topics)
@@ -806,29 +957,9 @@ def publish_sensor_data():
                 "location": "raspberry_pi"
             }
 
-            # Publish to individual topics
-            mqtt_client.publish("beeper/sensors/bme680/temperature",
-                              json.dumps({"value": temperature, "timestamp": timestamp}))
-            mqtt_client.publish("beeper/sensors/bme680/humidity",
-                              json.dumps({"value": humidity, "timestamp": timestamp}))
-            mqtt_client.publish("beeper/sensors/bme680/pressure",
-                              json.dumps({"value": pressure, "timestamp": timestamp}))
-            mqtt_client.publish("beeper/sensors/bme680/gas",
-                              json.dumps({"value": gas_raw, "timestamp": timestamp}))
-
-            # Publish air quality metrics (from BSEC)
-            if iaq is not None:
-                mqtt_client.publish("beeper/sensors/bme680/iaq",
-                                  json.dumps({"value": iaq, "timestamp": timestamp}))
-            if co2_equivalent is not None:
-                mqtt_client.publish("beeper/sensors/bme680/co2_equivalent",
-                                  json.dumps({"value": co2_equivalent, "timestamp": timestamp}))
-            if iaq_classification is not None:
-                mqtt_client.publish("beeper/sensors/bme680/iaq_classification",
-                                  json.dumps({"value": iaq_classification, "timestamp": timestamp}))
-
-            # Publish combined data (main topic used by Grafana)
-            mqtt_client.publish("beeper/sensors/bme680/all", json.dumps(data))
+            # Publish combined data (the only BME680 topic Grafana, alerts and the
+            # web app read - per-field duplicates were dropped to cut MQTT frames)
+            mqtt_client.publish("beeper/sensors/bme680/all", dumps_json(data))
 
             # Log sensor readings
             if iaq is not None:
@@ -848,55 +979,40 @@ def publish_sensor_data():
             "sensor_type": "cpu",
             "location": "raspberry_pi"
         }
-        mqtt_client.publish("beeper/sensors/cpu/temperature", json.dumps(data))
+        mqtt_client.publish("beeper/sensors/cpu/temperature", dumps_json(data))
         print(f"📤 CPU Temp: {cpu_temp}°C")
 
     # System Stats
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Non-blocking: utilization since the previous call (one publish interval)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        now = time.monotonic()
+        checked_at, disk_percent = disk_usage_cache
+        if now - checked_at >= DISK_POLL_INTERVAL:
+            disk_percent = psutil.disk_usage('/').percent
+            disk_usage_cache = (now, disk_percent)
 
         system_data = {
             "cpu_percent": round(cpu_percent, 1),
             "memory_percent": round(memory.percent, 1),
-            "disk_percent": round(disk.percent, 1),
+            "disk_percent": round(disk_percent, 1),
             "timestamp": timestamp
         }
 
-        mqtt_client.publish("beeper/system/stats", json.dumps(system_data))
-        mqtt_client.publish("beeper/system/cpu_percent",
-                          json.dumps({"value": cpu_percent, "timestamp": timestamp}))
-        mqtt_client.publish("beeper/system/memory_percent",
-                          json.dumps({"value": memory.percent, "timestamp": timestamp}))
-        mqtt_client.publish("beeper/system/disk_percent",
-                          json.dumps({"value": disk.percent, "timestamp": timestamp}))
+        mqtt_client.publish("beeper/system/stats", dumps_json(system_data))
 
-        print(f"📤 System: CPU {cpu_percent}%, RAM {memory.percent}%, Disk {disk.percent}%")
+        print(f"📤 System: CPU {cpu_percent}%, RAM {memory.percent}%, Disk {disk_percent}%")
     except Exception as e:
         print(f"✗ System stats error: {e}")
 
     # Camera Metadata (if available)
     try:
-        if os.path.exists('/tmp/camera_metadata_stream.txt'):
-            with open('/tmp/camera_metadata_stream.txt', 'rb') as f:
-                f.seek(0, 2)
-                file_size = f.tell()
-                read_size = min(5000, file_size)
-                f.seek(max(0, file_size - read_size))
-                tail_data = f.read().decode('utf-8', errors='ignore')
-
-            last_brace = tail_data.rfind('}')
-            if last_brace != -1:
-                search_start = max(0, last_brace - 2000)
-                chunk = tail_data[search_start:last_brace+1]
-                first_brace = chunk.rfind('{')
-                if first_brace != -1:
-                    json_str = chunk[first_brace:]
-                    metadata = json.loads(json_str)
-                    metadata['timestamp'] = timestamp
-                    mqtt_client.publish("beeper/camera/csi/metadata", json.dumps(metadata))
-                    print(f"📤 Camera metadata published")
+        metadata = read_camera_metadata()
+        if metadata is not None:
+            metadata = dict(metadata, timestamp=timestamp)
+            mqtt_client.publish("beeper/camera/csi/metadata", dumps_json(metadata))
+            print(f"📤 Camera metadata published")
     except Exception as e:
         pass  # Camera metadata is optional
 
@@ -914,10 +1030,8 @@ def publish_sensor_data():
             audio_level, raw_audio_data = get_audio_level()
 
             if audio_level is not None:
-                # Update history for rolling averages
+                # Update history for rolling averages (deque discards the oldest)
                 audio_history.append(audio_level)
-                if len(audio_history) > AUDIO_HISTORY_SIZE:
-                    audio_history.pop(0)  # Remove oldest
 
                 # Publish basic audio level (existing topic)
                 level_data = {
@@ -926,7 +1040,7 @@ def publish_sensor_data():
                     "sensor_type": "microphone",
                     "location": "raspberry_pi"
                 }
-                mqtt_client.publish("beeper/audio/level", json.dumps(level_data))
+                mqtt_client.publish("beeper/audio/level", dumps_json(level_data))
                 print(f"📤 Audio: {audio_level} dB", end="")
 
                 # Get statistics (rolling averages, peak, stddev)
@@ -939,7 +1053,7 @@ def publish_sensor_data():
                         "sensor_type": "microphone",
                         "location": "raspberry_pi"
                     }
-                    mqtt_client.publish("beeper/audio/stats/all", json.dumps(stats_data))
+                    mqtt_client.publish("beeper/audio/stats/all", dumps_json(stats_data))
                     print(f" | 60s avg: {stats['avg_60s']:.1f} dB" if stats.get('avg_60s') else "", end="")
 
                 # Detect activity state
@@ -950,7 +1064,7 @@ def publish_sensor_data():
                     "sensor_type": "microphone",
                     "location": "raspberry_pi"
                 }
-                mqtt_client.publish("beeper/audio/events/activity_state", json.dumps(event_data))
+                mqtt_client.publish("beeper/audio/events/activity_state", dumps_json(event_data))
                 print(f" | State: {activity_state}", end="")
 
                 # Perform frequency analysis (if we have raw audio data)
@@ -965,7 +1079,7 @@ def publish_sensor_data():
                             "sensor_type": "microphone",
                             "location": "raspberry_pi"
                         }
-                        mqtt_client.publish("beeper/audio/frequency/all", json.dumps(freq_data))
+                        mqtt_client.publish("beeper/audio/frequency/all", dumps_json(freq_data))
 
                         # Print frequency info
                         peak_freq = freq_analysis.get('peak_frequency', 0)
@@ -1013,7 +1127,7 @@ def get_ml_feed_level():
 
         if result.returncode == 0:
             # Parse JSON output
-            prediction = json.loads(result.stdout.strip())
+            prediction = loads_json(result.stdout.strip())
             percent = round(prediction['percent_full'], 2)
             # Derive level from percentage
             if percent >= 75:
@@ -1053,7 +1167,7 @@ def publish_feed_level_cached():
             mqtt_client.publish("beeper/feed/level/confidence", feed_data['confidence'])
 
             # Publish combined payload
-            payload = json.dumps(feed_data)
+            payload = dumps_json(feed_data)
             mqtt_client.publish("beeper/feed/level/all", payload)
 
             print(f"📊 Feed Level: {feed_data['percent_full']}% (confidence: {feed_data['confidence']}%)")
@@ -1117,6 +1231,9 @@ def main():
     # Initialize Audio Monitoring
     init_audio()
 
+    # Prime psutil's CPU counters so the first cycle's cpu_percent covers the startup wait
+    psutil.cpu_percent(interval=None)
+
     # Wait for MQTT connection
     time.sleep(2)
 
@@ -1124,12 +1241,24 @@ def main():
     print("Press Ctrl+C to stop\n")
 
     try:
+        # Fixed-rate schedule: sleep to the next deadline so publish time
+        # doesn't stretch the period; late ticks are dropped, not bunched
+        deadline = time.monotonic()
         while True:
             publish_sensor_data()
             print()  # Blank line between updates
-            time.sleep(PUBLISH_INTERVAL_SECONDS)
+            # stdout is block-buffered under systemd: one write per cycle, not per line
+            sys.stdout.flush()
+            deadline += PUBLISH_INTERVAL_SECONDS
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                deadline = time.monotonic()
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down MQTT publisher...")
+        if audio_proc is not None:
+            audio_proc.terminate()
         mqtt_client.loop_stop()
         mqtt_client.disconnect()
         print("✓ Disconnected from MQTT broker")